@@ -313,6 +313,11 @@ class TestClass(BasisTest, object):
         assert os.path.exists(
             self.aedtapp.eval_surface_quantity_from_field_summary(box, savedir=self.aedtapp.working_directory)
         )
+        num_lists = len(self.aedtapp.modeler.user_lists)
+        assert os.path.exists(
+            self.aedtapp.eval_surface_quantity_from_field_summary(box, savedir=self.aedtapp.working_directory)
+        )
+        assert len(self.aedtapp.modeler.user_lists) == num_lists
 
     def test_19B_get_output_variable(self):
         value = self.aedtapp.get_output_variable("OutputVariable1")
@@ -348,6 +353,12 @@ class TestClass(BasisTest, object):
         result = self.aedtapp.create_source_blocks_from_list([["box2", 2], ["box3", 3]])
         assert result[1].props["Total Power"] == "2W"
         assert result[3].props["Total Power"] == "3W"
+        self.aedtapp.modeler.create_box([5, 5, 5], [1, 1, 1], "box4", "copper")
+        csv_file = os.path.join(self.local_scratch.path, "source_blocks.csv")
+        with open(csv_file, "w") as f:
+            f.write("box4, 4\n")
+        result = self.aedtapp.create_source_blocks_from_list(csv_file, assign_material=False)
+        assert result[1].props["Total Power"] == "4W"
 
     def test_23_create_network_blocks(self):
         self.aedtapp.modeler.create_box([1, 2, 3], [10, 10, 10], "network_box", "copper")
@@ -553,6 +564,21 @@ class TestClass(BasisTest, object):
         fan = self.aedtapp.create_fan("Fan1", cross_section="YZ", radius="15mm", hub_radius="5mm", origin=[5, 21, 1])
         assert fan
         assert fan.component_name in self.aedtapp.modeler.oeditor.Get3DComponentInstanceNames(fan.component_name)[0]
+        with self.aedtapp.batch_native_components():
+            fan2 = self.aedtapp.create_fan("Fan2", origin=[5, 41, 1])
+            fan3 = self.aedtapp.create_fan("Fan3", origin=[5, 61, 1])
+        for fan_obj in [fan2, fan3]:
+            assert fan_obj.name in self.aedtapp.modeler.user_defined_components
+            fan_parts = self.aedtapp.modeler.user_defined_components[fan_obj.name].parts
+            assert fan_parts
+            for part in fan_parts.values():
+                assert self.aedtapp.modeler[part.name].name == part.name
+        batch_fans = [fan2.component_name, fan3.component_name]
+        for nc_name, native in self.aedtapp.native_components.items():
+            if nc_name in batch_fans:
+                assert native.delete()
+        assert all(i not in self.aedtapp.native_components for i in batch_fans)
+        assert fan.component_name in self.aedtapp.native_components
 
     def test_36_create_heat_sink(self):
         self.aedtapp.insert_design("HS")
@@ -979,6 +1005,16 @@ class TestClass(BasisTest, object):
                 ext_surf_rad_ref_temp=0,
                 ext_surf_rad_view_factor=0.5,
             )
+        wall = self.aedtapp.assign_stationary_wall_with_htc(
+            "surf1",
+            ht_correlation=True,
+            ht_correlation_type="Natural Convection",
+            ht_correlation_surface="Top",
+            ht_correlation_amb_temperature=25,
+        )
+        assert wall.props["Heat Transfer Data"]["Surface"] == "Top"
+        assert wall.props["Heat Transfer Data"]["Ambient Temperature"] == "25cel"
+        assert not self.aedtapp.assign_stationary_wall("surf1", "Radiation")
 
     @pytest.mark.skipif(config["desktopVersion"] < "2023.1" and config["use_grpc"], reason="Not working in 2022.2 GRPC")
     def test_55_native_components_history(self):
@@ -1184,6 +1220,11 @@ class TestClass(BasisTest, object):
         assert isinstance(net.faces_ids_in_network, list)
         assert isinstance(net.objects_in_network, list)
         assert isinstance(net.boundary_nodes, dict)
+        update_calls = []
+        net.update = lambda: update_calls.append(True) or True
+        net["Faces"] = net.props["Faces"]
+        assert update_calls
+        del net.update
         net.update_assignment()
         nodes_list = list(net.nodes.values())
         nodes_list[0].node_type
@@ -17,7 +17,6 @@ import os
 # PyAEDT Packages
 import pyaedt
 from pyaedt import Icepak
-from pyaedt import Desktop
 from pyaedt import Hfss3dLayout
 from pyaedt.modules.Boundary import BoundaryObject
 
@@ -30,6 +29,13 @@ from pyaedt.modules.Boundary import BoundaryObject
 
 non_graphical = False
 
+###############################################################################
+# Set AEDT version
+# ~~~~~~~~~~~~~~~~
+# Set the AEDT version. The same session is reused by every design in this example.
+
+desktop_version = "2023.1"
+
 
 ###############################################################################
 # Download and open project
@@ -39,7 +45,7 @@ non_graphical = False
 temp_folder = pyaedt.generate_unique_folder_name()
 
 ipk = pyaedt.Icepak(projectname=os.path.join(temp_folder, "Icepak_ECAD_Import.aedt"),
-                    specified_version="2023.1",
+                    specified_version=desktop_version,
                     new_desktop_session=True,
                     non_graphical=non_graphical
                     )
@@ -92,9 +98,9 @@ ipk.save_project()       # saves the project
 
 Layout_name = 'A1_uprev'          # 3D layout name available for import, the extension of .aedb should not be listed here
 
-hfss3dLO = Hfss3dLayout('Icepak_ECAD_Import', 'PCB_temp')      # adding a dummy HFSS 3D layout to the current project
+hfss3dLO = Hfss3dLayout(projectname=ipk.project_name, designname='PCB_temp',
+                        specified_version=desktop_version)              # adding a dummy HFSS 3D layout to the current project
 
-#edb_full_path = os.path.join(os.getcwd(), Layout_name+'.aedb\edb.def')   # path to the EDB file
 hfss3dLO.import_edb(def_path)                                       # importing the EDB file           
 hfss3dLO.save_project()                                                  # save the new project so files are stored in the path     
 
@@ -105,7 +111,7 @@ ipk.delete_design(name='PCB_temp', fallback_design=None)                 # delet
 
 component_name = "PCB_ECAD"
 
-odb_path = os.path.join(temp_folder, 'icepak/Icepak_ECAD_Import/'+Layout_name+'.aedt')
+odb_path = os.path.join(temp_folder, 'icepak', 'Icepak_ECAD_Import', Layout_name + '.aedt')
 ipk.create_pcb_from_3dlayout(
     component_name, odb_path, Layout_name, resolution=2, extenttype="Polygon", outlinepolygon='poly_0', 
     custom_x_resolution=None, custom_y_resolution=None,power_in=1)
@@ -137,7 +137,7 @@ class Analysis(Design, object):
 
         self.parametrics = ParametricSetups(self)
         self.optimizations = OptimizationSetups(self)
-        self._native_components = []
+        self._native_components = OrderedDict()
         self.SOLUTIONS = SOLUTIONS()
         self.SETUPS = SETUPS()
         self.AXIS = AXIS()
@@ -155,7 +155,7 @@ class Analysis(Design, object):
         """
         if not self._native_components:
             self._native_components = self._get_native_data()
-        return {nc.component_name: nc for nc in self._native_components}
+        return OrderedDict(self._native_components)
 
     @property
     def output_variables(self):
@@ -344,9 +344,9 @@ class Analysis(Design, object):
         >>> oModule.GelAllSolutionNames
         >>> oModule.GetSweeps
         """
-
-        if len(self.existing_analysis_sweeps) > 1:
-            return self.existing_analysis_sweeps[1]
+        sweeps = self.existing_analysis_sweeps
+        if len(sweeps) > 1:
+            return sweeps[1]
         else:
             return self.nominal_adaptive
 
@@ -872,7 +872,7 @@ class Analysis(Design, object):
     @pyaedt_function_handler()
     def _get_native_data(self):
         """Retrieve Native Components data."""
-        boundaries = []
+        boundaries = OrderedDict()
         try:
             data_vals = self.design_properties["ModelSetup"]["GeometryCore"]["GeometryOperations"][
                 "SubModelDefinitions"
@@ -882,13 +882,12 @@ class Analysis(Design, object):
             for ds in data_vals:
                 try:
                     if isinstance(ds, (OrderedDict, dict)):
-                        boundaries.append(
-                            NativeComponentObject(
-                                self,
-                                ds["NativeComponentDefinitionProvider"]["Type"],
-                                ds["BasicComponentInfo"]["ComponentName"],
-                                ds,
-                            )
+                        component_name = ds["BasicComponentInfo"]["ComponentName"]
+                        boundaries[component_name] = NativeComponentObject(
+                            self,
+                            ds["NativeComponentDefinitionProvider"]["Type"],
+                            component_name,
+                            ds,
                         )
                 except:
                     pass
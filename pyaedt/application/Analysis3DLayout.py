@@ -422,8 +422,8 @@ class FieldAnalysis3DLayout(Analysis):
         """
         if setuptype is None:
             setuptype = self.design_solutions.default_setup
-        elif setuptype in SetupKeys.SetupNames:
-            setuptype = SetupKeys.SetupNames.index(setuptype)
+        elif setuptype in SetupKeys.SetupNameIndex:
+            setuptype = SetupKeys.SetupNameIndex[setuptype]
         name = self.generate_unique_setup_name(setupname)
         setup = Setup3DLayout(self, setuptype, name)
         setup.create()
@@ -436,7 +436,7 @@ class FieldAnalysis3DLayout(Analysis):
             if arg_name == "props":
                 continue
             if setup[arg_name] is not None:
-                setup[arg_name] = arg_value
+                setup._set_prop(arg_name, arg_value)
         setup.auto_update = True
         setup.update()
         self.setups.append(setup)
@@ -570,8 +570,8 @@ class FieldAnalysisCircuit(Analysis):
         """
         if setuptype is None:
             setuptype = self.design_solutions.default_setup
-        elif setuptype in SetupKeys.SetupNames:
-            setuptype = SetupKeys.SetupNames.index(setuptype)
+        elif setuptype in SetupKeys.SetupNameIndex:
+            setuptype = SetupKeys.SetupNameIndex[setuptype]
         name = self.generate_unique_setup_name(setupname)
         setup = SetupCircuit(self, setuptype, name)
         setup.create()
@@ -584,7 +584,7 @@ class FieldAnalysisCircuit(Analysis):
             if arg_name == "props":
                 continue
             if setup[arg_name] is not None:
-                setup[arg_name] = arg_value
+                setup._set_prop(arg_name, arg_value)
         setup.auto_update = True
         setup.update()
         self.setups.append(setup)
@@ -325,17 +325,18 @@ class Design(AedtObjects):
                 bb.append(self.get_oo_property_value(othermal, thermal, "Type"))
 
             if self.modeler.user_defined_components:
+                thermal_boundaries = None
+                bb_names = set(bb)
                 for component in self.modeler.user_defined_components:
                     thermal_properties = self.get_oo_properties(self.oeditor, component)
                     if thermal_properties and "Type" not in thermal_properties and thermal_properties[-1] != "Icepak":
-                        thermal_boundaries = self.design_properties["BoundarySetup"]["Boundaries"]
-                        for component_boundary in thermal_boundaries:
-                            if component_boundary not in bb and isinstance(
-                                thermal_boundaries[component_boundary], dict
-                            ):
-                                boundarytype = thermal_boundaries[component_boundary]["BoundType"]
+                        if thermal_boundaries is None:
+                            thermal_boundaries = self.design_properties["BoundarySetup"]["Boundaries"]
+                        for component_boundary, boundary_props in thermal_boundaries.items():
+                            if component_boundary not in bb_names and isinstance(boundary_props, dict):
                                 bb.append(component_boundary)
-                                bb.append(boundarytype)
+                                bb.append(boundary_props["BoundType"])
+                                bb_names.add(component_boundary)
 
         current_boundaries = bb[::2]
         current_types = bb[1::2]
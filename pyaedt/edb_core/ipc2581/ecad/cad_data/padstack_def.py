@@ -1,4 +1,5 @@
 from pyaedt.edb_core.ipc2581.ecad.cad_data.padstack_hole_def import PadstackHoleDef
+from pyaedt.edb_core.ipc2581.ecad.cad_data.padstack_pad_def import PadUse
 from pyaedt.edb_core.ipc2581.ecad.cad_data.padstack_pad_def import PadstackPadDef
 from pyaedt.generic.general_methods import ET
 
@@ -21,7 +22,7 @@ class PadstackDef(object):
             if len([pad for pad in value if isinstance(pad, PadstackPadDef)]) == len(value):
                 self._padstack_pad_def = value
 
-    def add_padstack_pad_def(self, layer="", pad_use="REGULAR", x="0", y="0", primitive_ref=""):  # pragma no cover
+    def add_padstack_pad_def(self, layer="", pad_use=PadUse.Regular, x="0", y="0", primitive_ref=""):  # pragma no cover
         pad = PadstackPadDef()
         pad.layer_ref = layer
         pad.pad_use = pad_use
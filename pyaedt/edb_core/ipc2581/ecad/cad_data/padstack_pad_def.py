@@ -1,26 +1,25 @@
 from pyaedt.generic.general_methods import ET
 
 
+class PadUse(object):
+    """IPC2581 ``padUse`` attribute values."""
+
+    (Regular, Antipad, Thermal) = ("REGULAR", "ANTIPAD", "THERMAL")
+
+
 class PadstackPadDef(object):
     """Class describing an IPC2581 padstack definition."""
 
+    __slots__ = ("layer_ref", "pad_use", "x", "y", "primitive_ref")
+
     def __init__(self):
         self.layer_ref = ""
-        self.pad_use = "REGULAR"
+        self.pad_use = PadUse.Regular
         self.x = 0.0
         self.y = 0.0
         self.primitive_ref = "CIRCLE_DEFAULT"
 
     def write_xml(self, padstack_def):  # pragma no cover
-        pad_def = ET.SubElement(padstack_def, "PadstackPadDef")
-        pad_def.set("layerRef", self.layer_ref)
-        pad_def.set("padUse", self.pad_use)
-        location = ET.SubElement(pad_def, "Location")
-        location.set("x", str(self.x))
-        location.set("y", str(self.y))
-        standard_primitive = ET.SubElement(pad_def, "StandardPrimitiveRef")
-        standard_primitive.set("id", self.primitive_ref)
-
-
-class PadUse(object):
-    (Regular, Antipad, Thermal) = range(0, 3)
+        pad_def = ET.SubElement(padstack_def, "PadstackPadDef", {"layerRef": self.layer_ref, "padUse": self.pad_use})
+        ET.SubElement(pad_def, "Location", {"x": str(self.x), "y": str(self.y)})
+        ET.SubElement(pad_def, "StandardPrimitiveRef", {"id": self.primitive_ref})
@@ -4,6 +4,7 @@ from pyaedt.edb_core.ipc2581.bom.bom import Bom
 from pyaedt.edb_core.ipc2581.bom.bom_item import BomItem
 from pyaedt.edb_core.ipc2581.content.content import Content
 from pyaedt.edb_core.ipc2581.ecad.cad_data.padstack_def import PadstackDef
+from pyaedt.edb_core.ipc2581.ecad.cad_data.padstack_pad_def import PadUse
 from pyaedt.edb_core.ipc2581.ecad.ecad import Ecad
 from pyaedt.edb_core.ipc2581.history_record import HistoryRecord
 from pyaedt.edb_core.ipc2581.logistic_header import LogisticHeader
@@ -102,7 +103,7 @@ class Ipc2581(object):
                             ]
                     else:
                         primitive_ref = "Default"
-                    padstack_def.add_padstack_pad_def(layer=layer, pad_use="REGULAR", primitive_ref=primitive_ref)
+                    padstack_def.add_padstack_pad_def(layer=layer, pad_use=PadUse.Regular, primitive_ref=primitive_ref)
             for layer, antipad in padstackdef.antipad_by_layer.items():
                 if antipad.parameters_values:
                     if antipad.geometry_type == 1:
@@ -147,7 +148,7 @@ class Ipc2581(object):
                             ]
                     else:
                         primitive_ref = "Default"
-                    padstack_def.add_padstack_pad_def(layer=layer, pad_use="ANTIPAD", primitive_ref=primitive_ref)
+                    padstack_def.add_padstack_pad_def(layer=layer, pad_use=PadUse.Antipad, primitive_ref=primitive_ref)
             for layer, thermalpad in padstackdef.thermalpad_by_layer.items():
                 if thermalpad.parameters_values:
                     if thermalpad.geometry_type == 1:
@@ -192,7 +193,7 @@ class Ipc2581(object):
                             ]
                     else:
                         primitive_ref = "Default"
-                    padstack_def.add_padstack_pad_def(layer=layer, pad_use="THERMAL", primitive_ref=primitive_ref)
+                    padstack_def.add_padstack_pad_def(layer=layer, pad_use=PadUse.Thermal, primitive_ref=primitive_ref)
             if not padstack_def.name in self.ecad.cad_data.cad_data_step.padstack_defs:
                 self.ecad.cad_data.cad_data_step.padstack_defs[padstack_def.name] = padstack_def
 
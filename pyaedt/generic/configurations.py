@@ -1232,11 +1232,12 @@ class Configurations(object):
     @pyaedt_function_handler()
     def _export_monitor(self, dict_out):
         dict_monitor = {}
+        native_components = self._app.native_components
         native_parts = [
             part.name
             for udc_name, udc in self._app.modeler.user_defined_components.items()
             for part_name, part in udc.parts.items()
-            if self._app.modeler.user_defined_components[udc_name].definition_name in self._app.native_components
+            if self._app.modeler.user_defined_components[udc_name].definition_name in native_components
         ]
         if self._app.monitor.all_monitors != {}:
             for mon_name in self._app.monitor.all_monitors:
@@ -1924,8 +1925,8 @@ class ConfigurationsIcepak(Configurations):
                 ][0]
                 self._app.modeler.refresh_all_ids()
                 self._app.materials._load_from_project()
-                if native.component_name not in self._app.native_components:
-                    self._app._native_components.append(native)
+                if native.component_name not in self._app._native_components:
+                    self._app._native_components[native.component_name] = native
                 if instance_dict.get("Operations", None):
                     for _, operation_dict in instance_dict["Operations"].items():
                         apply_operations_to_native_components(
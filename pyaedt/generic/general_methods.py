@@ -30,6 +30,7 @@ is_linux = os.name == "posix"
 is_windows = not is_linux
 _pythonver = sys.version_info[0]
 inside_desktop = True if is_ironpython and "4.0.30319.42000" in sys.version else False
+_unique_name_char_set = string.ascii_uppercase + string.digits
 
 if not is_ironpython:
     import psutil
@@ -574,8 +575,7 @@ def generate_unique_name(rootname, suffix="", n=6):
         Newly generated name.
 
     """
-    char_set = string.ascii_uppercase + string.digits
-    uName = "".join(random.choice(char_set) for _ in range(n))
+    uName = "".join(random.choice(_unique_name_char_set) for _ in range(n))
     unique_name = rootname + "_" + uName
     if suffix:
         unique_name += "_" + suffix
@@ -1366,6 +1366,11 @@ class PropsManager(object):
         value : int, float, bool, str, dict
             Value to apply.
         """
+        self._set_prop(key, value)
+        self.update()
+
+    def _set_prop(self, key, value):
+        # Set the ``self.props`` key value without updating the object in AEDT.
         item_split = key.split("/")
         if len(item_split) == 1:
             item_split = item_split[0].split("__")
@@ -1393,10 +1398,8 @@ class PropsManager(object):
                 matching_percentage -= 0.02
         if found_el:
             found_el[1][found_el[2]] = value
-            self.update()
         else:
             props[key] = value
-            self.update()
             self._app.logger.warning("Key %s not found. Trying to applying new key ", key)
 
     @pyaedt_function_handler()
@@ -1535,8 +1538,7 @@ def _uname(name=None):
     str
 
     """
-    char_set = string.ascii_uppercase + string.digits
-    unique_name = "".join(random.sample(char_set, 6))
+    unique_name = "".join(random.sample(_unique_name_char_set, 6))
     if name:
         return name + unique_name
     else:
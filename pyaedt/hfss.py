@@ -757,8 +757,8 @@ class Hfss(FieldAnalysis3D, object):
         """
         if setuptype is None:
             setuptype = self.design_solutions.default_setup
-        elif setuptype in SetupKeys.SetupNames:
-            setuptype = SetupKeys.SetupNames.index(setuptype)
+        elif setuptype in SetupKeys.SetupNameIndex:
+            setuptype = SetupKeys.SetupNameIndex[setuptype]
         setup = self._create_setup(setupname=setupname, setuptype=setuptype)
         setup.auto_update = False
         for arg_name, arg_value in kwargs.items():
@@ -773,7 +773,7 @@ class Hfss(FieldAnalysis3D, object):
                             setup[arg_name][i] = [k]
                     setup.props["SolveType"] = "MultiFrequency"
                 else:
-                    setup[arg_name] = arg_value
+                    setup._set_prop(arg_name, arg_value)
         setup.auto_update = True
         setup.update()
         return setup
@@ -1205,7 +1205,7 @@ class Hfss(FieldAnalysis3D, object):
                 self.modeler, native.name, native_props["NativeComponentDefinitionProvider"], antenna_type
             )
             self.modeler.user_defined_components[native.name] = user_defined_component
-            self._native_components.append(native)
+            self._native_components[native.component_name] = native
             self.logger.info("Native component %s %s has been correctly created.", antenna_type, antenna_name)
             return native
         self.logger.error("Error in native component creation for %s %s.", antenna_type, antenna_name)
@@ -3,9 +3,11 @@
 from __future__ import absolute_import  # noreorder
 
 from collections import OrderedDict
+from contextlib import contextmanager
 import csv
 import math
 import os
+import random
 import warnings
 
 from pyaedt import is_ironpython
@@ -22,11 +24,12 @@ import re
 
 from pyaedt.application.Analysis3D import FieldAnalysis3D
 from pyaedt.generic.DataHandlers import _arg2dict
-from pyaedt.generic.DataHandlers import random_string
 from pyaedt.generic.configurations import ConfigurationsIcepak
 from pyaedt.generic.general_methods import generate_unique_name
+from pyaedt.generic.general_methods import is_number
 from pyaedt.generic.general_methods import open_file
 from pyaedt.generic.general_methods import pyaedt_function_handler
+from pyaedt.generic.general_methods import settings
 from pyaedt.modeler.cad.components_3d import UserDefinedComponent
 from pyaedt.modeler.geometry_operators import GeometryOperators
 from pyaedt.modules.Boundary import BoundaryObject
@@ -34,6 +37,20 @@ from pyaedt.modules.Boundary import NativeComponentObject
 from pyaedt.modules.Boundary import NetworkObject
 from pyaedt.modules.monitor_icepak import Monitor
 
+RADIATION_SETTINGS = {
+    "Nothing": (False, False),
+    "Low": (True, False),
+    "High": (False, True),
+    "Both": (True, True),
+}
+
+HOLLOW_BLOCK_CONDITIONS = {
+    "Total Power": ("Fixed Heat", "Total Power"),
+    "Heat Flux": ("Fixed Heat", "Heat Flux"),
+    "Temperature": ("Fixed Temperature", "Fixed Temperature"),
+    "Heat Transfer Coefficient": ("Internal Conditions", "Heat Transfer Coefficient"),
+}
+
 
 class Icepak(FieldAnalysis3D):
     """Provides the Icepak application interface.
@@ -163,6 +180,8 @@ class Icepak(FieldAnalysis3D):
         )
         self._monitor = Monitor(self)
         self._configurations = ConfigurationsIcepak(self)
+        self._deferred_refresh = 0
+        self._face_list_names = {}
 
     def __enter__(self):
         return self
@@ -263,24 +282,22 @@ class Icepak(FieldAnalysis3D):
         if boundary_name is None:
             boundary_name = generate_unique_name("Grille")
 
-        self.modeler.create_face_list(air_faces, "boundary_faces" + boundary_name)
-        props = {}
-        air_faces = self.modeler.convert_to_selections(air_faces, True)
+        modeler = self.modeler
+        modeler.create_face_list(air_faces, "boundary_faces" + boundary_name)
+        air_faces = modeler.convert_to_selections(air_faces, True)
 
-        props["Faces"] = air_faces
         if free_loss_coeff:
-            props["Pressure Loss Type"] = "Coeff"
-            props["Free Area Ratio"] = str(free_area_ratio)
-            props["External Rad. Temperature"] = external_temp
-            props["External Total Pressure"] = expternal_pressure
-
+            props = {"Faces": air_faces, "Pressure Loss Type": "Coeff", "Free Area Ratio": str(free_area_ratio)}
         else:
-            props["Pressure Loss Type"] = "Curve"
-            props["External Rad. Temperature"] = external_temp
-            props["External Total Pressure"] = expternal_pressure
-
-        props["X"] = x_curve
-        props["Y"] = y_curve
+            props = {"Faces": air_faces, "Pressure Loss Type": "Curve"}
+        props.update(
+            {
+                "External Rad. Temperature": external_temp,
+                "External Total Pressure": expternal_pressure,
+                "X": x_curve,
+                "Y": y_curve,
+            }
+        )
         bound = BoundaryObject(self, boundary_name, props, "Grille")
         if bound.create():
             self._boundaries[bound.name] = bound
@@ -319,15 +336,17 @@ class Icepak(FieldAnalysis3D):
         PyAEDT INFO: Opening Assigned
         """
         boundary_name = generate_unique_name("Opening")
-        self.modeler.create_face_list(air_faces, "boundary_faces" + boundary_name)
-        props = {}
-        air_faces = self.modeler.convert_to_selections(air_faces, True)
+        modeler = self.modeler
+        modeler.create_face_list(air_faces, "boundary_faces" + boundary_name)
+        air_faces = modeler.convert_to_selections(air_faces, True)
 
-        props["Faces"] = air_faces
-        props["Temperature"] = "AmbientTemp"
-        props["External Rad. Temperature"] = "AmbientRadTemp"
-        props["Inlet Type"] = "Pressure"
-        props["Total Pressure"] = "AmbientPressure"
+        props = {
+            "Faces": air_faces,
+            "Temperature": "AmbientTemp",
+            "External Rad. Temperature": "AmbientRadTemp",
+            "Inlet Type": "Pressure",
+            "Total Pressure": "AmbientPressure",
+        }
         bound = BoundaryObject(self, boundary_name, props, "Opening")
         if bound.create():
             self._boundaries[bound.name] = bound
@@ -397,10 +416,11 @@ class Icepak(FieldAnalysis3D):
 
         Parameters
         ----------
-        list_powers : list
+        list_powers : list or str
             List of input powers. It is a list of lists. For example,
             ``[["Obj1", 1], ["Obj2", 3]]``. The list can contain multiple
-            columns for power inputs.
+            columns for power inputs. The full path to a CSV file with the
+            same layout and no header row is also accepted.
         assign_material : bool, optional
             Whether to assign a material. The default is ``True``.
         default_material : str, optional
@@ -431,21 +451,25 @@ class Icepak(FieldAnalysis3D):
         >>> blocks[3].props
         {'Objects': ['BlockBox2'], 'Block Type': 'Solid', 'Use External Conditions': False, 'Total Power': '4W'}
         """
-        oObjects = self.modeler.solid_names
+        if isinstance(list_powers, str):
+            with open_file(list_powers) as csvfile:
+                list_powers = [[i.strip() for i in row] for row in csv.reader(csvfile) if row]
         listmcad = []
-        num_power = None
+        if not list_powers:
+            return listmcad
+        oObjects = set(self.modeler.solid_names)
+        num_power = len(list_powers[0]) - 1
+        self["P_index"] = 0
         for row in list_powers:
-            if not num_power:
-                num_power = len(row) - 1
-                self["P_index"] = 0
             if row[0] in oObjects:
                 listmcad.append(row)
                 if num_power > 1:
-                    self[row[0] + "_P"] = str(row[1:])
+                    self[row[0] + "_P"] = "[" + ", ".join(str(i) for i in row[1:]) + "]"
                     out = self.create_source_block(row[0], row[0] + "_P[P_index]", assign_material, default_material)
 
                 else:
-                    out = self.create_source_block(row[0], str(row[1]) + "W", assign_material, default_material)
+                    power = str(row[1]) + "W" if is_number(row[1]) else row[1]
+                    out = self.create_source_block(row[0], power, assign_material, default_material)
                 if out:
                     listmcad.append(out)
 
@@ -493,21 +517,21 @@ class Icepak(FieldAnalysis3D):
         {'Objects': ['BlockBox3'], 'Block Type': 'Solid', 'Use External Conditions': False, 'Total Power': '1W'}
 
         """
-        if assign_material:
-            if isinstance(object_name, list):
-                for el in object_name:
-                    self.modeler[el].material_name = material_name
-            else:
-                self.modeler[object_name].material_name = material_name
-        props = {}
+        modeler = self.modeler
         if not isinstance(object_name, list):
             object_name = [object_name]
-        object_name = self.modeler.convert_to_selections(object_name, True)
-        props["Objects"] = object_name
-
-        props["Block Type"] = "Solid"
-        props["Use External Conditions"] = False
-        props["Total Power"] = input_power
+        if assign_material:
+            for el in object_name:
+                obj = modeler[el]
+                if not obj.model or obj.material_name.lower() != material_name.lower():
+                    obj.material_name = material_name
+        object_name = modeler.convert_to_selections(object_name, True)
+        props = {
+            "Objects": object_name,
+            "Block Type": "Solid",
+            "Use External Conditions": False,
+            "Total Power": input_power,
+        }
         if use_object_for_name:
             boundary_name = object_name[0]
         else:
@@ -594,34 +618,30 @@ class Icepak(FieldAnalysis3D):
             props["Faces"] = face_id
         elif isinstance(face_id[0], str):
             props["Objects"] = face_id
+        props["LowSide"] = {"Radiate": bool(radiate_low)}
         if radiate_low:
-            props["LowSide"] = OrderedDict(
-                {"Radiate": True, "RadiateTo": "AllObjects", "Surface Material": low_surf_material}
-            )
-        else:
-            props["LowSide"] = OrderedDict({"Radiate": False})
+            props["LowSide"].update({"RadiateTo": "AllObjects", "Surface Material": low_surf_material})
+        props["HighSide"] = {"Radiate": bool(radiate_high)}
         if radiate_high:
-            props["HighSide"] = OrderedDict(
-                {"Radiate": True, "RadiateTo": "AllObjects - High", "Surface Material - High": high_surf_material}
-            )
-        else:
-            props["HighSide"] = OrderedDict({"Radiate": False})
-        props["Thermal Specification"] = thermal_specification
-        props["Thickness"] = thickness
-        props["Solid Material"] = solid_material
-        props["Conductance"] = thermal_conductance
-        props["Thermal Resistance"] = thermal_resistance
-        props["Thermal Impedance"] = thermal_impedance
+            props["HighSide"].update({"RadiateTo": "AllObjects - High", "Surface Material - High": high_surf_material})
+        props.update(
+            {
+                "Thermal Specification": thermal_specification,
+                "Thickness": thickness,
+                "Solid Material": solid_material,
+                "Conductance": thermal_conductance,
+                "Thermal Resistance": thermal_resistance,
+                "Thermal Impedance": thermal_impedance,
+            }
+        )
         if thermal_dependent_dataset is None:
             props["Total Power"] = input_power
         else:
-            props["Total Power Variation Data"] = OrderedDict(
-                {
-                    "Variation Type": "Temp Dep",
-                    "Variation Function": "Piecewise Linear",
-                    "Variation Value": '["1W", "pwl({},Temp)"]'.format(thermal_dependent_dataset),
-                }
-            )
+            props["Total Power Variation Data"] = {
+                "Variation Type": "Temp Dep",
+                "Variation Function": "Piecewise Linear",
+                "Variation Value": '["1W", "pwl({},Temp)"]'.format(thermal_dependent_dataset),
+            }
         props["Shell Conduction"] = shell_conduction
         bound = BoundaryObject(self, bc_name, props, "Conducting Plate")
         try:
@@ -710,16 +730,12 @@ class Icepak(FieldAnalysis3D):
         if thermal_dependent_dataset is None:
             props["Total Power"] = input_power
         else:
-            props["Total Power Variation Data"] = OrderedDict(
-                {
-                    "Variation Type": "Temp Dep",
-                    "Variation Function": "Piecewise Linear",
-                    "Variation Value": '["1W", "pwl({},Temp)"]'.format(thermal_dependent_dataset),
-                }
-            )
-        props["Surface Heat"] = surface_heat
-        props["Temperature"] = temperature
-        props["Radiation"] = OrderedDict({"Radiate": radiate})
+            props["Total Power Variation Data"] = {
+                "Variation Type": "Temp Dep",
+                "Variation Function": "Piecewise Linear",
+                "Variation Value": '["1W", "pwl({},Temp)"]'.format(thermal_dependent_dataset),
+            }
+        props.update({"Surface Heat": surface_heat, "Temperature": temperature, "Radiation": {"Radiate": radiate}})
         bound = BoundaryObject(self, source_name, props, "SourceIcepak")
         try:
             if bound.create():
@@ -791,55 +807,40 @@ class Icepak(FieldAnalysis3D):
             "This method is deprecated in 0.6.27. Use the create_two_resistor_network_block() method.",
             DeprecationWarning,
         )
-        if object_name in self.modeler.object_names:
+        object_3d = self.modeler.get_object_from_name(object_name)
+        if object_3d:
             if gravity_dir > 2:
                 gravity_dir = gravity_dir - 3
-            faces_dict = self.modeler[object_name].faces
-            faceCenter = {}
-            for f in faces_dict:
-                faceCenter[f.id] = f.center
-            fcmax = -1e9
-            fcmin = 1e9
-            fcrjc = None
-            fcrjb = None
-            for fc in faceCenter:
-                fc1 = faceCenter[fc]
-                if fc1[gravity_dir] < fcmin:
-                    fcmin = fc1[gravity_dir]
-                    fcrjb = int(fc)
-                if fc1[gravity_dir] > fcmax:
-                    fcmax = fc1[gravity_dir]
-                    fcrjc = int(fc)
+            faces_dict = object_3d.faces
+            face_centers = [(f.id, f.center[gravity_dir]) for f in faces_dict]
+            fcrjb = min(face_centers, key=lambda fc: fc[1])[0]
+            fcrjc, fcmax = max(face_centers, key=lambda fc: fc[1])
             if fcmax < float(top):
-                app = fcrjc
-                fcrjc = fcrjb
-                fcrjb = app
+                fcrjc, fcrjb = fcrjb, fcrjc
             if assign_material:
-                self.modeler[object_name].material_name = default_material
+                object_3d.material_name = default_material
             props = {}
             if use_object_for_name:
                 boundary_name = object_name
             else:
                 boundary_name = generate_unique_name("Block")
+            face_rjc = "Face{}".format(fcrjc)
+            face_rjb = "Face{}".format(fcrjb)
             props["Faces"] = [fcrjc, fcrjb]
-            props["Nodes"] = OrderedDict(
-                {
-                    "Face" + str(fcrjc): [fcrjc, "NoResistance"],
-                    "Face" + str(fcrjb): [fcrjb, "NoResistance"],
-                    "Internal": [power],
-                }
-            )
-            props["Links"] = OrderedDict(
-                {
-                    "Link1": ["Face" + str(fcrjc), "Internal", "R", str(rjc) + "cel_per_w"],
-                    "Link2": ["Face" + str(fcrjb), "Internal", "R", str(rjb) + "cel_per_w"],
-                }
-            )
-            props["SchematicData"] = OrderedDict({})
+            props["Nodes"] = {
+                face_rjc: [fcrjc, "NoResistance"],
+                face_rjb: [fcrjb, "NoResistance"],
+                "Internal": [power],
+            }
+            props["Links"] = {
+                "Link1": [face_rjc, "Internal", "R", "{}cel_per_w".format(rjc)],
+                "Link2": [face_rjb, "Internal", "R", "{}cel_per_w".format(rjb)],
+            }
+            props["SchematicData"] = {}
             bound = BoundaryObject(self, boundary_name, props, "Network")
             if bound.create():
                 self._boundaries[bound.name] = bound
-                self.modeler[object_name].solve_inside = False
+                object_3d.solve_inside = False
                 return bound
             return None
 
@@ -885,13 +886,13 @@ class Icepak(FieldAnalysis3D):
         >>> blocks[0].props["Nodes"]["Internal"]
         ['3W']
         """
-        objs = self.modeler.solid_names
+        objs = set(self.modeler.solid_names)
         countpow = len(input_list[0]) - 3
         networks = []
         for row in input_list:
             if row[0] in objs:
                 if countpow > 1:
-                    self[row[0] + "_P"] = str(row[3:])
+                    self[row[0] + "_P"] = "[" + ", ".join(str(i) for i in row[3:]) + "]"
                     self["P_index"] = 0
                     out = self.create_network_block(
                         row[0],
@@ -1042,44 +1043,31 @@ class Icepak(FieldAnalysis3D):
 
         >>> oModule.AssignBlockBoundary
         """
-        with open_file(csv_name) as csvfile:
-            csv_input = csv.reader(csvfile)
-            component_header = next(csv_input)
-            data = list(csv_input)
-            k = 0
-            component_data = {}
-            for el in component_header:
-                component_data[el] = [i[k] for i in data]
-                k += 1
         total_power = 0
-        i = 0
-        all_objects = self.modeler.object_names
-        for power in component_data["Applied Power (W)"]:
-            try:
-                float(power)
-                if "COMP_" + component_data["Ref Des"][i] in all_objects:
-                    status = self.create_source_block(
-                        "COMP_" + component_data["Ref Des"][i], str(power) + "W", assign_material=False
-                    )
-                    if not status:
-                        self.logger.warning(
-                            "Warning. Block %s skipped with %sW power.", component_data["Ref Des"][i], power
-                        )
-                    else:
-                        total_power += float(power)
-                elif component_data["Ref Des"][i] in all_objects:
-                    status = self.create_source_block(
-                        component_data["Ref Des"][i], str(power) + "W", assign_material=False
-                    )
-                    if not status:
-                        self.logger.warning(
-                            "Warning. Block %s skipped with %sW power.", component_data["Ref Des"][i], power
-                        )
-                    else:
-                        total_power += float(power)
-            except:
-                pass
-            i += 1
+        all_objects = set(self.modeler.object_names)
+        with open_file(csv_name) as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            power_index = header.index("Applied Power (W)")
+            ref_des_index = header.index("Ref Des")
+            for row in reader:
+                try:
+                    power = row[power_index]
+                    ref_des = row[ref_des_index]
+                    power_value = float(power)
+                except (IndexError, ValueError):
+                    continue
+                if "COMP_" + ref_des in all_objects:
+                    object_name = "COMP_" + ref_des
+                elif ref_des in all_objects:
+                    object_name = ref_des
+                else:
+                    continue
+                status = self.create_source_block(object_name, power + "W", assign_material=False)
+                if not status:
+                    self.logger.warning("Warning. Block %s skipped with %sW power.", ref_des, power)
+                else:
+                    total_power += power_value
         self.logger.info("Blocks inserted with total power %sW.", total_power)
         return total_power
 
@@ -1107,22 +1095,20 @@ class Icepak(FieldAnalysis3D):
         temp_log = os.path.join(self.working_directory, "validation.log")
         validate = self.odesign.ValidateDesign(temp_log)
         self.save_project()
-        i = 2
         if validate == 0:
             priority_list = []
+            found = set()
+            name_pattern = re.compile(re.escape(component_prefix) + r'[^"]*(?=")')
             with open_file(temp_log, "r") as f:
-                lines = f.readlines()
-                for line in lines:
-                    if "[error]" in line and component_prefix in line and "intersect" in line:
-                        id1 = line.find(component_prefix)
-                        id2 = line[id1:].find('"')
-                        name = line[id1 : id1 + id2]
-                        if name not in priority_list:
-                            priority_list.append(name)
+                for line in f:
+                    if "[error]" in line and "intersect" in line:
+                        match = name_pattern.search(line)
+                        if match and match.group() not in found:
+                            found.add(match.group())
+                            priority_list.append(match.group())
             self.logger.info("{} Intersections have been found. Applying Priorities".format(len(priority_list)))
-            for objname in priority_list:
-                self.mesh.add_priority(1, [objname], priority=i)
-                i += 1
+            if priority_list:
+                self.mesh.add_priorities([([objname], priority) for priority, objname in enumerate(priority_list, 2)])
         return True
 
     @pyaedt_function_handler()
@@ -1145,22 +1131,19 @@ class Icepak(FieldAnalysis3D):
         >>> oEditor.GetModelBoundingBox
         """
         dirs = ["-X", "+X", "-Y", "+Y", "-Z", "+Z"]
-        for dir in dirs:
-            argsval = ["NAME:" + dir + " Padding Data", "Value:=", "0"]
-            args = [
-                "NAME:AllTabs",
-                [
-                    "NAME:Geometry3DCmdTab",
-                    ["NAME:PropServers", "Region:CreateRegion:1"],
-                    ["NAME:ChangedProps", argsval],
-                ],
-            ]
-            self.modeler.oeditor.ChangeProperty(args)
+        changed_props = ["NAME:ChangedProps"]
+        changed_props.extend(["NAME:" + dir + " Padding Data", "Value:=", "0"] for dir in dirs)
+        args = [
+            "NAME:AllTabs",
+            [
+                "NAME:Geometry3DCmdTab",
+                ["NAME:PropServers", "Region:CreateRegion:1"],
+                changed_props,
+            ],
+        ]
+        self.modeler.oeditor.ChangeProperty(args)
         oBoundingBox = self.modeler.get_model_bounding_box()
-        if gravityDir < 3:
-            return oBoundingBox[gravityDir + 3]
-        else:
-            return oBoundingBox[gravityDir - 3]
+        return oBoundingBox[(gravityDir + 3) % 6]
 
     @pyaedt_function_handler()
     def create_parametric_fin_heat_sink(
@@ -1248,25 +1231,27 @@ class Icepak(FieldAnalysis3D):
         ...                                        plane_enum=icepak.PLANE.XY, rotation=45, tolerance=0.005)
 
         """
-        all_objs = self.modeler.object_names
-        self["FinPitch"] = self.modeler._arg_with_dim(pitch)
-        self["FinThickness"] = self.modeler._arg_with_dim(thick)
-        self["FinLength"] = self.modeler._arg_with_dim(length)
-        self["FinHeight"] = self.modeler._arg_with_dim(height)
+        modeler = self.modeler
+        arg_with_dim = modeler._arg_with_dim
+        all_objs = set(modeler.object_names)
+        self["FinPitch"] = arg_with_dim(pitch)
+        self["FinThickness"] = arg_with_dim(thick)
+        self["FinLength"] = arg_with_dim(length)
+        self["FinHeight"] = arg_with_dim(height)
         self["DraftAngle"] = draftangle
         self["PatternAngle"] = patternangle
-        self["FinSeparation"] = self.modeler._arg_with_dim(separation)
-        self["VerticalSeparation"] = self.modeler._arg_with_dim(vertical_separation)
-        self["HSHeight"] = self.modeler._arg_with_dim(hs_height)
-        self["HSWidth"] = self.modeler._arg_with_dim(hs_width)
-        self["HSBaseThick"] = self.modeler._arg_with_dim(hs_basethick)
+        self["FinSeparation"] = arg_with_dim(separation)
+        self["VerticalSeparation"] = arg_with_dim(vertical_separation)
+        self["HSHeight"] = arg_with_dim(hs_height)
+        self["HSWidth"] = arg_with_dim(hs_width)
+        self["HSBaseThick"] = arg_with_dim(hs_basethick)
         if numcolumn_perside > 1:
             self["NumColumnsPerSide"] = numcolumn_perside
         if symmetric:
-            self["SymSeparation"] = self.modeler._arg_with_dim(symmetric_separation)
-        self["Tolerance"] = self.modeler._arg_with_dim(tolerance)
+            self["SymSeparation"] = arg_with_dim(symmetric_separation)
+        self["Tolerance"] = arg_with_dim(tolerance)
 
-        self.modeler.create_box(
+        modeler.create_box(
             ["-HSWidth/200", "-HSHeight/200", "-HSBaseThick"],
             ["HSWidth*1.01", "HSHeight*1.01", "HSBaseThick+Tolerance"],
             "HSBase",
@@ -1278,7 +1263,7 @@ class Icepak(FieldAnalysis3D):
         fin_line.append(self.Position("FinLength", "FinThickness + FinLength*sin(PatternAngle*3.14/180)", 0))
         fin_line.append(self.Position("FinLength", "FinLength*sin(PatternAngle*3.14/180)", 0))
         fin_line.append(self.Position(0, 0, 0))
-        self.modeler.create_polyline(fin_line, cover_surface=True, name="Fin")
+        modeler.create_polyline(fin_line, cover_surface=True, name="Fin")
         fin_line2 = []
         fin_line2.append(self.Position(0, "sin(DraftAngle*3.14/180)*FinThickness", "FinHeight"))
         fin_line2.append(self.Position(0, "FinThickness-sin(DraftAngle*3.14/180)*FinThickness", "FinHeight"))
@@ -1295,33 +1280,31 @@ class Icepak(FieldAnalysis3D):
             )
         )
         fin_line2.append(self.Position(0, "sin(DraftAngle*3.14/180)*FinThickness", "FinHeight"))
-        self.modeler.create_polyline(fin_line2, cover_surface=True, name="Fin_top")
-        self.modeler.connect(["Fin", "Fin_top"])
-        self.modeler["Fin"].material_name = matname
+        modeler.create_polyline(fin_line2, cover_surface=True, name="Fin_top")
+        modeler.connect(["Fin", "Fin_top"])
+        modeler["Fin"].material_name = matname
         num = int((hs_width * 1.25 / (separation + thick)) / (max(1 - math.sin(patternangle * 3.14 / 180), 0.1)))
-        self.modeler.move("Fin", self.Position(0, "-FinSeparation-FinThickness", 0))
-        self.modeler.duplicate_along_line("Fin", self.Position(0, "FinSeparation+FinThickness", 0), num, True)
-        all_names = self.modeler.object_names
-        list = [i for i in all_names if "Fin" in i]
+        modeler.move("Fin", self.Position(0, "-FinSeparation-FinThickness", 0))
+        modeler.duplicate_along_line("Fin", self.Position(0, "FinSeparation+FinThickness", 0), num, True)
+        # Clones are attached to "Fin", so no new objects exist until the first split.
+        fin_list = ["Fin"]
         if numcolumn_perside > 0:
-            self.modeler.duplicate_along_line(
-                list,
+            modeler.duplicate_along_line(
+                fin_list,
                 self.Position("FinLength+VerticalSeparation", "FinLength*sin(PatternAngle*3.14/180)", 0),
                 "NumColumnsPerSide",
                 True,
             )
 
-        all_names = self.modeler.object_names
-        list = [i for i in all_names if "Fin" in i]
-        self.modeler.split(list, self.PLANE.ZX, "PositiveOnly")
-        all_names = self.modeler.object_names
-        list = [i for i in all_names if "Fin" in i]
-        self.modeler.create_coordinate_system(self.Position(0, "HSHeight", 0), mode="view", view="XY", name="TopRight")
-        self.modeler.set_working_coordinate_system("TopRight")
-        self.modeler.split(list, self.PLANE.ZX, "NegativeOnly")
+        modeler.split(fin_list, self.PLANE.ZX, "PositiveOnly")
+        all_names = modeler.object_names
+        fin_list = [i for i in all_names if "Fin" in i]
+        modeler.create_coordinate_system(self.Position(0, "HSHeight", 0), mode="view", view="XY", name="TopRight")
+        modeler.set_working_coordinate_system("TopRight")
+        modeler.split(fin_list, self.PLANE.ZX, "NegativeOnly")
 
         if symmetric:
-            self.modeler.create_coordinate_system(
+            modeler.create_coordinate_system(
                 self.Position("(HSWidth-SymSeparation)/2", 0, 0),
                 mode="view",
                 view="XY",
@@ -1329,48 +1312,47 @@ class Icepak(FieldAnalysis3D):
                 reference_cs="TopRight",
             )
 
-            self.modeler.split(list, self.PLANE.YZ, "NegativeOnly")
-            self.modeler.create_coordinate_system(
+            modeler.split(fin_list, self.PLANE.YZ, "NegativeOnly")
+            modeler.create_coordinate_system(
                 self.Position("SymSeparation/2", 0, 0),
                 mode="view",
                 view="XY",
                 name="CenterRight",
                 reference_cs="CenterRightSep",
             )
-            self.modeler.duplicate_and_mirror(list, self.Position(0, 0, 0), self.Position(1, 0, 0))
+            modeler.duplicate_and_mirror(fin_list, self.Position(0, 0, 0), self.Position(1, 0, 0))
             center_line = []
             center_line.append(self.Position("-SymSeparation", "Tolerance", "-Tolerance"))
             center_line.append(self.Position("SymSeparation", "Tolerance", "-Tolerance"))
             center_line.append(self.Position("VerticalSeparation", "-HSHeight-Tolerance", "-Tolerance"))
             center_line.append(self.Position("-VerticalSeparation", "-HSHeight-Tolerance", "-Tolerance"))
             center_line.append(self.Position("-SymSeparation", "Tolerance", "-Tolerance"))
-            self.modeler.create_polyline(center_line, cover_surface=True, name="Center")
-            self.modeler.thicken_sheet("Center", "-FinHeight-2*Tolerance")
-            all_names = self.modeler.object_names
-            list = [i for i in all_names if "Fin" in i]
-            self.modeler.subtract(list, "Center", False)
+            modeler.create_polyline(center_line, cover_surface=True, name="Center")
+            modeler.thicken_sheet("Center", "-FinHeight-2*Tolerance")
+            all_names = modeler.object_names
+            fin_list = [i for i in all_names if "Fin" in i]
+            modeler.subtract(fin_list, "Center", False)
         else:
-            self.modeler.create_coordinate_system(
+            modeler.create_coordinate_system(
                 self.Position("HSWidth", 0, 0), mode="view", view="XY", name="BottomRight", reference_cs="TopRight"
             )
-            self.modeler.split(list, self.PLANE.YZ, "NegativeOnly")
-        all_objs2 = self.modeler.object_names
-        list_to_move = [i for i in all_objs2 if i not in all_objs]
+            modeler.split(fin_list, self.PLANE.YZ, "NegativeOnly")
+        list_to_move = [i for i in modeler.object_names if i not in all_objs]
         center[0] -= hs_width / 2
         center[1] -= hs_height / 2
         center[2] += hs_basethick
-        self.modeler.set_working_coordinate_system("Global")
-        self.modeler.move(list_to_move, center)
+        modeler.set_working_coordinate_system("Global")
+        modeler.move(list_to_move, center)
         if plane_enum == self.PLANE.XY:
-            self.modeler.rotate(list_to_move, self.AXIS.X, rotation)
+            modeler.rotate(list_to_move, self.AXIS.X, rotation)
         elif plane_enum == self.PLANE.ZX:
-            self.modeler.rotate(list_to_move, self.AXIS.X, 90)
-            self.modeler.rotate(list_to_move, self.AXIS.Y, rotation)
+            modeler.rotate(list_to_move, self.AXIS.X, 90)
+            modeler.rotate(list_to_move, self.AXIS.Y, rotation)
         elif plane_enum == self.PLANE.YZ:
-            self.modeler.rotate(list_to_move, self.AXIS.Y, 90)
-            self.modeler.rotate(list_to_move, self.AXIS.Z, rotation)
-        self.modeler.unite(list_to_move)
-        self.modeler[list_to_move[0]].name = "HeatSink1"
+            modeler.rotate(list_to_move, self.AXIS.Y, 90)
+            modeler.rotate(list_to_move, self.AXIS.Z, rotation)
+        modeler.unite(list_to_move)
+        modeler[list_to_move[0]].name = "HeatSink1"
         return True
 
     @pyaedt_function_handler()
@@ -1383,7 +1365,7 @@ class Icepak(FieldAnalysis3D):
         defaultfluid="air",
         defaultsolid="Al-Extruded",
         export_monitor=False,
-        export_directory=os.getcwd(),
+        export_directory=None,
     ):
         """Update the main settings of the design.
 
@@ -1408,7 +1390,8 @@ class Icepak(FieldAnalysis3D):
             Whether to use the default export directory for monitor point data.
             The default value is ``False``.
         export_directory : str, optional
-            Default export directory for monitor point data. The default value is the current working directory.
+            Default export directory for monitor point data. The default is ``None``, in which
+            case the current working directory is used.
 
         Returns
         -------
@@ -1420,6 +1403,8 @@ class Icepak(FieldAnalysis3D):
 
         >>> oDesign.SetDesignSettings
         """
+        if export_directory is None:
+            export_directory = os.getcwd()
         if ambtemp and not isinstance(ambtemp, str):
             AmbientTemp = str(ambtemp) + "cel"
         else:
@@ -1427,10 +1412,8 @@ class Icepak(FieldAnalysis3D):
         #
         # Configure design settings for gravity etc
         IceGravity = ["X", "Y", "Z"]
-        GVPos = False
-        if int(gravityDir) > 2:
-            GVPos = True
-        GVA = IceGravity[int(gravityDir) - 3]
+        GVPos = int(gravityDir) > 2
+        GVA = IceGravity[int(gravityDir) % 3]
         self._odesign.SetDesignSettings(
             [
                 "NAME:Design Settings Data",
@@ -1536,9 +1519,7 @@ class Icepak(FieldAnalysis3D):
         # Generate a list of model objects from the lists made previously and use to map the HFSS losses into Icepak
         #
         if not object_list:
-            all_objects = self.modeler.object_names
-            if "Region" in all_objects:
-                all_objects.remove("Region")
+            all_objects = [i for i in self.modeler.object_names if i != "Region"]
         else:
             all_objects = object_list[:]
 
@@ -1548,30 +1529,26 @@ class Icepak(FieldAnalysis3D):
         else:
             intr = []
 
-        argparam = OrderedDict({})
-        for el in self.available_variations.nominal_w_values_dict:
-            argparam[el] = self.available_variations.nominal_w_values_dict[el]
+        argparam = OrderedDict()
+        argparam.update(self.available_variations.nominal_w_values_dict)
 
         if paramlist and isinstance(paramlist, list):
             for el in paramlist:
                 argparam[el] = el
         elif paramlist and isinstance(paramlist, dict):
-            for el in paramlist:
-                argparam[el] = paramlist[el]
+            argparam.update(paramlist)
 
-        props = OrderedDict(
-            {
-                "Objects": all_objects,
-                "Project": project_name,
-                "Product": "ElectronicsDesktop",
-                "Design": designname,
-                "Soln": setupname + " : " + sweepname,
-                "Params": argparam,
-                "ForceSourceToSolve": True,
-                "PreservePartnerSoln": True,
-                "PathRelativeTo": "TargetProject",
-            }
-        )
+        props = {
+            "Objects": all_objects,
+            "Project": project_name,
+            "Product": "ElectronicsDesktop",
+            "Design": designname,
+            "Soln": setupname + " : " + sweepname,
+            "Params": argparam,
+            "ForceSourceToSolve": True,
+            "PreservePartnerSoln": True,
+            "PathRelativeTo": "TargetProject",
+        }
         props["Intrinsics"] = intr
         props["SurfaceOnly"] = surfaces
 
@@ -1625,8 +1602,13 @@ class Icepak(FieldAnalysis3D):
 
         >>> oModule.ExportFieldsSummary
         """
-        name = generate_unique_name(quantity_name)
-        self.modeler.create_face_list(faces_list, name)
+        # Reuse the face list created by a previous export of the same faces if it still exists.
+        faces_key = tuple(sorted(faces_list, key=str))
+        name = self._face_list_names.get(faces_key)
+        if not name or name not in [i.name for i in self.modeler.user_lists]:
+            name = generate_unique_name(quantity_name)
+            self.modeler.create_face_list(faces_list, name)
+            self._face_list_names[faces_key] = name
         if not savedir:
             savedir = self.working_directory
         if not filename:
@@ -1639,9 +1621,7 @@ class Icepak(FieldAnalysis3D):
                 ["Object", "Surface", name, quantity_name, "", "Default", "AmbientTemp"],
             ]
         )
-        string = ""
-        for el in parameter_dict_with_values:
-            string += el + "='" + parameter_dict_with_values[el] + "' "
+        string = "".join(k + "='" + v + "' " for k, v in parameter_dict_with_values.items())
         filename = os.path.join(savedir, filename + ".csv")
         self.osolution.ExportFieldsSummary(
             [
@@ -1710,9 +1690,7 @@ class Icepak(FieldAnalysis3D):
                 ["Object", "Volume", ",".join(object_list), quantity_name, "", "Default", "AmbientTemp"],
             ]
         )
-        string = ""
-        for el in parameter_dict_with_values:
-            string += el + "='" + parameter_dict_with_values[el] + "' "
+        string = "".join(k + "='" + v + "' " for k, v in parameter_dict_with_values.items())
         filename = os.path.join(savedir, filename + ".csv")
         self.osolution.ExportFieldsSummary(
             [
@@ -1774,38 +1752,49 @@ class Icepak(FieldAnalysis3D):
         if variationlist == None:
             variationlist = []
 
-        all_objs = list(self.modeler.oeditor.GetObjectsInGroup("Solids"))
-        all_objs_NonModeled = list(self.modeler.oeditor.GetObjectsInGroup("Non Model"))
-        all_objs_model = [item for item in all_objs if item not in all_objs_NonModeled]
-        arg = []
+        oeditor = self.modeler.oeditor
+        all_objs_NonModeled = set(oeditor.GetObjectsInGroup("Non Model"))
+        all_objs_model = [item for item in oeditor.GetObjectsInGroup("Solids") if item not in all_objs_NonModeled]
         self.logger.info("Objects lists " + str(all_objs_model))
+        arg = []
         for el in all_objs_model:
-            try:
-                self.osolution.EditFieldsSummarySetting(
-                    ["Calculation:=", [type, geometryType, el, quantity, "", "Default"]]
-                )
-                arg.append("Calculation:=")
-                arg.append([type, geometryType, el, quantity, "", "Default"])
-            except Exception as e:
-                self.logger.error("Object " + el + " not added.")
-                self.logger.error(str(e))
+            arg.extend(("Calculation:=", [type, geometryType, el, quantity, "", "Default"]))
+        try:
+            self.osolution.EditFieldsSummarySetting(arg)
+        except Exception:
+            # Fall back to checking each object so that only the invalid ones are dropped.
+            arg = []
+            for el in all_objs_model:
+                try:
+                    self.osolution.EditFieldsSummarySetting(
+                        ["Calculation:=", [type, geometryType, el, quantity, "", "Default"]]
+                    )
+                    arg.extend(("Calculation:=", [type, geometryType, el, quantity, "", "Default"]))
+                except Exception as e:
+                    self.logger.error("Object " + el + " not added.")
+                    self.logger.error(str(e))
+            self.osolution.EditFieldsSummarySetting(arg)
         if not output_dir:
             output_dir = self.working_directory
-        self.osolution.EditFieldsSummarySetting(arg)
-        if not os.path.exists(output_dir):
-            os.mkdir(output_dir)
+        try:
+            os.makedirs(output_dir)
+        except OSError:
+            if not os.path.isdir(output_dir):
+                raise
         if not solution_name:
             solution_name = self.nominal_sweep
         if variation:
+            report_prefix = os.path.join(output_dir, "IPKsummaryReport" + quantity + "_")
             for l in variationlist:
+                value = str(l)
                 self.osolution.ExportFieldsSummary(
                     [
                         "SolutionName:=",
                         solution_name,
                         "DesignVariationKey:=",
-                        variation + "='" + str(l) + "'",
+                        variation + "='" + value + "'",
                         "ExportFileName:=",
-                        os.path.join(output_dir, "IPKsummaryReport" + quantity + "_" + str(l) + ".csv"),
+                        report_prefix + value + ".csv",
                     ]
                 )
         else:
@@ -1840,19 +1829,7 @@ class Icepak(FieldAnalysis3D):
         (bool, bool)
             Tuple containing the low side radiation and the high side radiation.
         """
-        if radiation == "Nothing":
-            low_side_radiation = False
-            high_side_radiation = False
-        elif radiation == "Low":
-            low_side_radiation = True
-            high_side_radiation = False
-        elif radiation == "High":
-            low_side_radiation = False
-            high_side_radiation = True
-        elif radiation == "Both":
-            low_side_radiation = True
-            high_side_radiation = True
-        return low_side_radiation, high_side_radiation
+        return RADIATION_SETTINGS[radiation]
 
     @pyaedt_function_handler()
     def get_link_data(self, links_data, **kwargs):
@@ -1913,6 +1890,34 @@ class Icepak(FieldAnalysis3D):
 
         return arg
 
+    def _refresh_after_native_component(self):
+        self.modeler.refresh_all_ids()
+        self.materials._load_from_project()
+
+    @contextmanager
+    def batch_native_components(self):
+        """Defer the model refresh done after each fan or PCB component creation.
+
+        Inside this context, ``create_fan`` and ``create_ipk_3dcomponent_pcb`` skip the
+        object ID and material refresh. It runs once when the outermost context exits.
+
+        Examples
+        --------
+        >>> from pyaedt import Icepak
+        >>> icepak = Icepak()
+        >>> with icepak.batch_native_components():
+        ...     for i in range(10):
+        ...         icepak.create_fan(origin=[i * 10, 0, 0])
+
+        """
+        self._deferred_refresh += 1
+        try:
+            yield self
+        finally:
+            self._deferred_refresh -= 1
+            if not self._deferred_refresh:
+                self._refresh_after_native_component()
+
     @pyaedt_function_handler()
     def create_fan(
         self,
@@ -1958,78 +1963,46 @@ class Icepak(FieldAnalysis3D):
         if not name:
             name = generate_unique_name("Fan")
 
-        basic_component = OrderedDict(
-            {
-                "ComponentName": name,
-                "Company": "",
-                "Company URL": "",
-                "Model Number": "",
-                "Help URL": "",
-                "Version": "1.0",
-                "Notes": "",
-                "IconType": "Fan",
-            }
-        )
         if is_2d:
             model = "2D"
         else:
             model = "3D"
         cross_section = GeometryOperators.cs_plane_to_plane_str(cross_section)
-        native_component = OrderedDict(
-            {
-                "Type": "Fan",
-                "Unit": self.modeler.model_units,
-                "ModelAs": model,
-                "Shape": shape,
-                "MovePlane": cross_section,
-                "Radius": self._arg_with_units(radius),
-                "HubRadius": self._arg_with_units(hub_radius),
-                "CaseSide": True,
-                "FlowDirChoice": "NormalPositive",
-                "FlowType": "Curve",
-                "SwirlType": "Magnitude",
-                "FailedFan": False,
-                "DimUnits": ["m3_per_s", "n_per_meter_sq"],
-                "X": ["0", "0.01"],
-                "Y": ["3", "0"],
-                "Pressure Loss Curve": OrderedDict(
-                    {"DimUnits": ["m_per_sec", "n_per_meter_sq"], "X": ["", "", "", "3"], "Y": ["", "1", "10", "0"]}
-                ),
-                "IntakeTemp": "AmbientTemp",
-                "Swirl": "0",
-                "OperatingRPM": "0",
-                "Magnitude": "1",
-            }
-        )
-        native_props = OrderedDict(
-            {
-                "TargetCS": "Global",
-                "SubmodelDefinitionName": name,
-                "ComponentPriorityLists": OrderedDict({}),
-                "NextUniqueID": 0,
-                "MoveBackwards": False,
-                "DatasetType": "ComponentDatasetType",
-                "DatasetDefinitions": OrderedDict({}),
-                "BasicComponentInfo": basic_component,
-                "GeometryDefinitionParameters": OrderedDict({"VariableOrders": OrderedDict()}),
-                "DesignDefinitionParameters": OrderedDict({"VariableOrders": OrderedDict()}),
-                "MaterialDefinitionParameters": OrderedDict({"VariableOrders": OrderedDict()}),
-                "MapInstanceParameters": "DesignVariable",
-                "UniqueDefinitionIdentifier": "57c8ab4e-4db9-4881-b6bb-"
-                + random_string(12, char_set="abcdef0123456789"),
-                "OriginFilePath": "",
-                "IsLocal": False,
-                "ChecksumString": "",
-                "ChecksumHistory": [],
-                "VersionHistory": [],
-                "NativeComponentDefinitionProvider": native_component,
-                "InstanceParameters": OrderedDict(
-                    {"GeometryParameters": "", "MaterialParameters": "", "DesignParameters": ""}
-                ),
-            }
-        )
+        native_component = {
+            "Type": "Fan",
+            "Unit": self.modeler.model_units,
+            "ModelAs": model,
+            "Shape": shape,
+            "MovePlane": cross_section,
+            "Radius": self._arg_with_units(radius),
+            "HubRadius": self._arg_with_units(hub_radius),
+            "CaseSide": True,
+            "FlowDirChoice": "NormalPositive",
+            "FlowType": "Curve",
+            "SwirlType": "Magnitude",
+            "FailedFan": False,
+            "DimUnits": ["m3_per_s", "n_per_meter_sq"],
+            "X": ["0", "0.01"],
+            "Y": ["3", "0"],
+            "Pressure Loss Curve": {
+                "DimUnits": ["m_per_sec", "n_per_meter_sq"],
+                "X": ["", "", "", "3"],
+                "Y": ["", "1", "10", "0"],
+            },
+            "IntakeTemp": "AmbientTemp",
+            "Swirl": "0",
+            "OperatingRPM": "0",
+            "Magnitude": "1",
+        }
+        # NativeComponentObject already builds the generic component skeleton, so only the
+        # fan-specific entries are passed and merged into it.
+        native_props = {
+            "BasicComponentInfo": {"IconType": "Fan"},
+            "UniqueDefinitionIdentifier": "57c8ab4e-4db9-4881-b6bb-" + "{:012x}".format(random.getrandbits(48)),
+            "NativeComponentDefinitionProvider": native_component,
+        }
 
-        component3d_names = list(self.modeler.oeditor.Get3DComponentInstanceNames(name))
+        component3d_names = set(self.modeler.oeditor.Get3DComponentInstanceNames(name))
 
         native = NativeComponentObject(self, "Fan", name, native_props)
         if native.create():
@@ -2037,12 +2010,11 @@ class Icepak(FieldAnalysis3D):
                 self.modeler, native.name, native_props["NativeComponentDefinitionProvider"], "Fan"
             )
             self.modeler.user_defined_components[native.name] = user_defined_component
-            new_name = [
-                i for i in list(self.modeler.oeditor.Get3DComponentInstanceNames(name)) if i not in component3d_names
-            ][0]
-            self.modeler.refresh_all_ids()
-            self.materials._load_from_project()
-            self._native_components.append(native)
+            instance_names = self.modeler.oeditor.Get3DComponentInstanceNames(name)
+            new_name = next(i for i in instance_names if i not in component3d_names)
+            if not self._deferred_refresh:
+                self._refresh_after_native_component()
+            self._native_components[native.component_name] = native
             if origin:
                 self.modeler.move(new_name, origin)
             return native
@@ -2144,27 +2116,17 @@ class Icepak(FieldAnalysis3D):
         )
         native_props["BasicComponentInfo"] = OrderedDict({"IconType": "PCB"})
 
-        if custom_x_resolution and custom_y_resolution:
-            native_props["NativeComponentDefinitionProvider"]["UseThermalLink"] = solutionFreq != ""
-            native_props["NativeComponentDefinitionProvider"]["CustomResolution"] = True
-            native_props["NativeComponentDefinitionProvider"]["CustomResolutionRow"] = custom_x_resolution
-            native_props["NativeComponentDefinitionProvider"]["CustomResolutionCol"] = 600
-            # compDefinition += ["UseThermalLink:=", solutionFreq!="",
-            #                    "CustomResolution:=", True, "CustomResolutionRow:=", custom_x_resolution,
-            #                    "CustomResolutionCol:=", 600]
-        else:
-            native_props["NativeComponentDefinitionProvider"]["UseThermalLink"] = solutionFreq != ""
-            native_props["NativeComponentDefinitionProvider"]["CustomResolution"] = False
-            # compDefinition += ["UseThermalLink:=", solutionFreq != "",
-            #                    "CustomResolution:=", False]
+        provider = native_props["NativeComponentDefinitionProvider"]
+        provider["UseThermalLink"] = solutionFreq != ""
+        provider["CustomResolution"] = bool(custom_x_resolution and custom_y_resolution)
+        if provider["CustomResolution"]:
+            provider["CustomResolutionRow"] = custom_x_resolution
+            provider["CustomResolutionCol"] = 600
         if solutionFreq:
-            native_props["NativeComponentDefinitionProvider"]["Frequency"] = solutionFreq
-            native_props["NativeComponentDefinitionProvider"]["DefnLink"] = hfss_link_info["DefnLink"]
-            # compDefinition += ["Frequency:=", solutionFreq, hfssLinkInfo]
+            provider["Frequency"] = solutionFreq
         else:
-            native_props["NativeComponentDefinitionProvider"]["Power"] = powerin
-            native_props["NativeComponentDefinitionProvider"]["DefnLink"] = hfss_link_info["DefnLink"]
-            # compDefinition += ["Power:=", powerin, hfssLinkInfo]
+            provider["Power"] = powerin
+        provider["DefnLink"] = hfss_link_info["DefnLink"]
 
         native_props["TargetCS"] = PCB_CS
         native = NativeComponentObject(self, "PCB", compName, native_props)
@@ -2173,9 +2135,9 @@ class Icepak(FieldAnalysis3D):
                 self.modeler, native.name, native_props["NativeComponentDefinitionProvider"], "PCB"
             )
             self.modeler.user_defined_components[native.name] = user_defined_component
-            self.modeler.refresh_all_ids()
-            self.materials._load_from_project()
-            self._native_components.append(native)
+            if not self._deferred_refresh:
+                self._refresh_after_native_component()
+            self._native_components[native.component_name] = native
             return native
         return False
 
@@ -2383,10 +2345,12 @@ class Icepak(FieldAnalysis3D):
 
         >>> oModule.EditGlobalMeshRegion
         """
-        bounding_box = self.modeler.oeditor.GetModelBoundingBox()
-        xsize = abs(float(bounding_box[0]) - float(bounding_box[3])) / (15 * meshtype * meshtype)
-        ysize = abs(float(bounding_box[1]) - float(bounding_box[4])) / (15 * meshtype * meshtype)
-        zsize = abs(float(bounding_box[2]) - float(bounding_box[5])) / (10 * meshtype)
+        xmin, ymin, zmin, xmax, ymax, zmax = [float(i) for i in self.modeler.oeditor.GetModelBoundingBox()]
+        xy_divisor = 15 * meshtype * meshtype
+        xsize = abs(xmin - xmax) / xy_divisor
+        ysize = abs(ymin - ymax) / xy_divisor
+        zsize = abs(zmin - zmax) / (10 * meshtype)
+        units = self.modeler.model_units
         MaxSizeRatio = 1 + (meshtype / 2)
 
         self.omeshmodule.EditGlobalMeshRegion(
@@ -2399,11 +2363,11 @@ class Icepak(FieldAnalysis3D):
                 "ComputeGap:=",
                 True,
                 "MaxElementSizeX:=",
-                str(xsize) + self.modeler.model_units,
+                str(xsize) + units,
                 "MaxElementSizeY:=",
-                str(ysize) + self.modeler.model_units,
+                str(ysize) + units,
                 "MaxElementSizeZ:=",
-                str(zsize) + self.modeler.model_units,
+                str(zsize) + units,
                 "MinElementsInGap:=",
                 gap_min_elements,
                 "MinElementsOnEdge:=",
@@ -2463,37 +2427,30 @@ class Icepak(FieldAnalysis3D):
         """
         self.modeler.edit_region_dimensions([0, 0, 0, 0, 0, 0])
 
-        vertex_ids = self.modeler.oeditor.GetVertexIDsFromObject("Region")
-
-        x_values = []
-        y_values = []
-        z_values = []
-
-        for vertex_id in vertex_ids:
-            tmp = self.modeler.oeditor.GetVertexPosition(vertex_id)
-            x_values.append(tmp[0])
-            y_values.append(tmp[1])
-            z_values.append(tmp[2])
+        oeditor = self.modeler.oeditor
+        if settings.aedt_version >= "2023.2":
+            bounding_box = [float(i) for i in oeditor.GetObjectBoundingBox("Region")]
+            x_values, y_values, z_values = zip(bounding_box[:3], bounding_box[3:])
+        else:
+            vertex_ids = oeditor.GetVertexIDsFromObject("Region")
+            positions = [[float(i) for i in oeditor.GetVertexPosition(vertex_id)] for vertex_id in vertex_ids]
+            x_values, y_values, z_values = zip(*positions)
 
         scale_factor = scale_factor - 1
-        delta_x = (float(max(x_values)) - float(min(x_values))) * scale_factor
-        x_max = float(max(x_values)) + delta_x / 2.0
-        x_min = float(min(x_values)) - delta_x / 2.0
-
-        delta_y = (float(max(y_values)) - float(min(y_values))) * scale_factor
-        y_max = float(max(y_values)) + delta_y / 2.0
-        y_min = float(min(y_values)) - delta_y / 2.0
-
-        delta_z = (float(max(z_values)) - float(min(z_values))) * scale_factor
-        z_max = float(max(z_values)) + delta_z / 2.0
-        z_min = float(min(z_values)) - delta_z / 2.0
-
-        dis_x = str(float(x_max) - float(x_min))
-        dis_y = str(float(y_max) - float(y_min))
-        dis_z = str(float(z_max) - float(z_min))
-
-        min_position = self.modeler.Position(str(x_min) + "mm", str(y_min) + "mm", str(z_min) + "mm")
-        mesh_box = self.modeler.create_box(min_position, [dis_x + "mm", dis_y + "mm", dis_z + "mm"], name)
+        min_corner = []
+        dimensions = []
+        for values in (x_values, y_values, z_values):
+            low = min(values)
+            high = max(values)
+            delta = (high - low) * scale_factor
+            low -= delta / 2.0
+            high += delta / 2.0
+            min_corner.append(str(low) + "mm")
+            dimensions.append(str(high - low))
+        dis_x, dis_y, dis_z = dimensions
+
+        min_position = self.modeler.Position(min_corner)
+        mesh_box = self.modeler.create_box(min_position, [i + "mm" for i in dimensions], name)
 
         self.modeler[name].model = False
 
@@ -2555,10 +2512,7 @@ class Icepak(FieldAnalysis3D):
         list
             List of all liquid material objects.
         """
-        mats = []
-        for el in self.materials.liquids:
-            mats.extend(self.modeler.convert_to_selections(self.modeler.get_objects_by_material(el), True))
-        return mats
+        return [obj.name for obj in self.modeler.get_objects_by_material(self.materials.liquids)]
 
     @pyaedt_function_handler()
     def get_gas_objects(self):
@@ -2569,10 +2523,7 @@ class Icepak(FieldAnalysis3D):
         list
             List of all gas objects.
         """
-        mats = []
-        for el in self.materials.gases:
-            mats.extend(self.modeler.convert_to_selections(self.modeler.get_objects_by_material(el), True))
-        return mats
+        return [obj.name for obj in self.modeler.get_objects_by_material(self.materials.gases)]
 
     @pyaedt_function_handler()
     def generate_fluent_mesh(self, object_lists=None):
@@ -2589,79 +2540,77 @@ class Icepak(FieldAnalysis3D):
         :class:`pyaedt.modules.Mesh.MeshOperation`
         """
         version = self.aedt_version_id[-3:]
-        ansys_install_dir = os.environ.get("ANSYS{}_DIR".format(version), "")
+        ansys_install_dir = os.environ.get("ANSYS{}_DIR".format(version))
         if not ansys_install_dir:
-            ansys_install_dir = os.environ.get("AWP_ROOT{}".format(version), "")
+            ansys_install_dir = os.environ.get("AWP_ROOT{}".format(version))
         assert ansys_install_dir, "Fluent {} has to be installed on to generate mesh.".format(version)
-        assert os.getenv("ANSYS{}_DIR".format(version))
         if not object_lists:
             object_lists = self.get_liquid_objects()
             assert object_lists, "No Fluids objects found."
-        object_lists = self.modeler.convert_to_selections(object_lists, True)
+        else:
+            object_lists = self.modeler.convert_to_selections(object_lists, True)
         file_name = self.project_name
-        sab_file_pointer = os.path.join(self.working_directory, file_name + ".sab")
-        mesh_file_pointer = os.path.join(self.working_directory, file_name + ".msh")
-        fl_uscript_file_pointer = os.path.join(self.working_directory, "FLUscript.jou")
-        if os.path.exists(mesh_file_pointer):
-            os.remove(mesh_file_pointer)
-        if os.path.exists(sab_file_pointer):
-            os.remove(sab_file_pointer)
-        if os.path.exists(fl_uscript_file_pointer):
-            os.remove(fl_uscript_file_pointer)
-        if os.path.exists(mesh_file_pointer + ".trn"):
-            os.remove(mesh_file_pointer + ".trn")
-        assert self.export_3d_model(file_name, self.working_directory, ".sab", object_lists), "Failed to export .sab"
+        working_directory = self.working_directory
+        sab_file_pointer = os.path.join(working_directory, file_name + ".sab")
+        mesh_file_pointer = os.path.join(working_directory, file_name + ".msh")
+        fl_uscript_file_pointer = os.path.join(working_directory, "FLUscript.jou")
+        for file_path in [mesh_file_pointer, sab_file_pointer, fl_uscript_file_pointer, mesh_file_pointer + ".trn"]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                if os.path.exists(file_path):
+                    raise
+        assert self.export_3d_model(file_name, working_directory, ".sab", object_lists), "Failed to export .sab"
 
         # Building Fluent journal script file *.jou
-        fluent_script = open(fl_uscript_file_pointer, "w")
-        fluent_script.write("/file/start-transcript " + '"' + mesh_file_pointer + '.trn"\n')
-        fluent_script.write(
-            '/file/set-tui-version "{}"\n'.format(self.aedt_version_id[-3:-1] + "." + self.aedt_version_id[-1:])
-        )
-        fluent_script.write("(enable-feature 'serial-hexcore-without-poly)\n")
-        fluent_script.write('(cx-gui-do cx-activate-tab-index "NavigationPane*Frame1(TreeTab)" 0)\n')
-        fluent_script.write("(%py-exec \"workflow.InitializeWorkflow(WorkflowType=r'Watertight Geometry')\")\n")
+        fluent_script = []
+        fluent_script.append("/file/start-transcript " + '"' + mesh_file_pointer + '.trn"\n')
+        fluent_script.append('/file/set-tui-version "{}.{}"\n'.format(version[:-1], version[-1:]))
+        fluent_script.append("(enable-feature 'serial-hexcore-without-poly)\n")
+        fluent_script.append('(cx-gui-do cx-activate-tab-index "NavigationPane*Frame1(TreeTab)" 0)\n')
+        fluent_script.append("(%py-exec \"workflow.InitializeWorkflow(WorkflowType=r'Watertight Geometry')\")\n")
         cmd = "(%py-exec \"workflow.TaskObject['Import Geometry']."
         cmd += "Arguments.setState({r'FileName': r'" + sab_file_pointer + "',})\")\n"
-        fluent_script.write(cmd)
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Import Geometry'].Execute()\")\n")
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Add Local Sizing'].AddChildToTask()\")\n")
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Add Local Sizing'].Execute()\")\n")
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Generate the Surface Mesh'].Execute()\")\n")
+        fluent_script.append(cmd)
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Import Geometry'].Execute()\")\n")
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Add Local Sizing'].AddChildToTask()\")\n")
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Add Local Sizing'].Execute()\")\n")
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Generate the Surface Mesh'].Execute()\")\n")
         cmd = "(%py-exec \"workflow.TaskObject['Describe Geometry'].UpdateChildTasks(SetupTypeChanged=False)\")\n"
-        fluent_script.write(cmd)
+        fluent_script.append(cmd)
         cmd = "(%py-exec \"workflow.TaskObject['Describe Geometry']."
         cmd += "Arguments.setState({r'SetupType': r'The geometry consists of only fluid regions with no voids',})\")\n"
-        fluent_script.write(cmd)
+        fluent_script.append(cmd)
         cmd = "(%py-exec \"workflow.TaskObject['Describe Geometry'].UpdateChildTasks(SetupTypeChanged=True)\")\n"
-        fluent_script.write(cmd)
+        fluent_script.append(cmd)
         cmd = "(%py-exec \"workflow.TaskObject['Describe Geometry'].Arguments.setState({r'InvokeShareTopology': r'Yes',"
         cmd += "r'SetupType': r'The geometry consists of only fluid regions with no voids',r'WallToInternal': "
         cmd += "r'Yes',})\")\n"
-        fluent_script.write(cmd)
+        fluent_script.append(cmd)
         cmd = "(%py-exec \"workflow.TaskObject['Describe Geometry'].UpdateChildTasks(SetupTypeChanged=False)\")\n"
-        fluent_script.write(cmd)
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Describe Geometry'].Execute()\")\n")
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Apply Share Topology'].Execute()\")\n")
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Update Boundaries'].Execute()\")\n")
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Update Regions'].Execute()\")\n")
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Add Boundary Layers'].AddChildToTask()\")\n")
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Add Boundary Layers'].InsertCompoundChildTask()\")\n")
+        fluent_script.append(cmd)
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Describe Geometry'].Execute()\")\n")
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Apply Share Topology'].Execute()\")\n")
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Update Boundaries'].Execute()\")\n")
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Update Regions'].Execute()\")\n")
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Add Boundary Layers'].AddChildToTask()\")\n")
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Add Boundary Layers'].InsertCompoundChildTask()\")\n")
         cmd = "(%py-exec \"workflow.TaskObject['smooth-transition_1']."
         cmd += "Arguments.setState({r'BLControlName': r'smooth-transition_1',})\")\n"
-        fluent_script.write(cmd)
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Add Boundary Layers'].Arguments.setState({})\")\n")
-        fluent_script.write("(%py-exec \"workflow.TaskObject['smooth-transition_1'].Execute()\")\n")
+        fluent_script.append(cmd)
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Add Boundary Layers'].Arguments.setState({})\")\n")
+        fluent_script.append("(%py-exec \"workflow.TaskObject['smooth-transition_1'].Execute()\")\n")
         # r'VolumeFill': r'hexcore' / r'tetrahedral'
         cmd = "(%py-exec \"workflow.TaskObject['Generate the Volume Mesh'].Arguments.setState({r'VolumeFill': "
         cmd += "r'hexcore', r'VolumeMeshPreferences': {r'MergeBodyLabels': r'yes',},})\")\n"
-        fluent_script.write(cmd)
-        fluent_script.write("(%py-exec \"workflow.TaskObject['Generate the Volume Mesh'].Execute()\")\n")
-        fluent_script.write("/file/hdf no\n")
-        fluent_script.write('/file/write-mesh "' + mesh_file_pointer + '"\n')
-        fluent_script.write("/file/stop-transcript\n")
-        fluent_script.write("/exit,\n")
-        fluent_script.close()
+        fluent_script.append(cmd)
+        fluent_script.append("(%py-exec \"workflow.TaskObject['Generate the Volume Mesh'].Execute()\")\n")
+        fluent_script.append("/file/hdf no\n")
+        fluent_script.append('/file/write-mesh "' + mesh_file_pointer + '"\n')
+        fluent_script.append("/file/stop-transcript\n")
+        fluent_script.append("/exit,\n")
+        with open_file(fl_uscript_file_pointer, "w") as f:
+            f.write("".join(fluent_script))
 
         # Fluent command line parameters: -meshing -i <journal> -hidden -tm<x> (# processors for meshing) -wait
         fl_ucommand = [
@@ -2669,16 +2618,24 @@ class Icepak(FieldAnalysis3D):
             "3d",
             "-meshing",
             "-hidden",
-            "-i" + '"' + fl_uscript_file_pointer + '"',
+            "-i",
+            fl_uscript_file_pointer,
         ]
         self.logger.info("Fluent is starting in BG.")
-        subprocess.call(fl_ucommand)
-        if os.path.exists(mesh_file_pointer + ".trn"):
-            os.remove(mesh_file_pointer + ".trn")
-        if os.path.exists(fl_uscript_file_pointer):
-            os.remove(fl_uscript_file_pointer)
-        if os.path.exists(sab_file_pointer):
-            os.remove(sab_file_pointer)
+        # Fluent console output is discarded; stderr is kept to report failures.
+        with open(os.devnull, "w") as devnull:
+            fluent_process = subprocess.Popen(
+                fl_ucommand, stdout=devnull, stderr=subprocess.PIPE, universal_newlines=True
+            )
+            _, fluent_errors = fluent_process.communicate()
+        if fluent_process.returncode:
+            self.logger.error("Fluent exited with code {}. {}".format(fluent_process.returncode, fluent_errors))
+        for file_path in [mesh_file_pointer + ".trn", fl_uscript_file_pointer, sab_file_pointer]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                if os.path.exists(file_path):
+                    raise
         if os.path.exists(mesh_file_pointer):
             self.logger.info("'" + mesh_file_pointer + "' has been created.")
             return self.mesh.assign_mesh_from_file(object_lists, mesh_file_pointer)
@@ -2727,11 +2684,8 @@ class Icepak(FieldAnalysis3D):
         """
         ambient_temperature = self.modeler._arg_with_dim(ambienttemp, "cel")
 
-        axes = ["X", "Y", "Z"]
-        GVPos = False
-        if int(gravityDir) > 2:
-            GVPos = True
-        gravity_axis = axes[int(gravityDir) - 3]
+        GVPos = int(gravityDir) > 2
+        gravity_axis = ["X", "Y", "Z"][int(gravityDir) % 3]
         self.odesign.SetDesignSettings(
             [
                 "NAME:Design Settings Data",
@@ -2913,67 +2867,64 @@ class Icepak(FieldAnalysis3D):
 
         >>> oDesign.ImportIDF
         """
+        board_root, board_ext = os.path.splitext(board_path)
         if not library_path:
-            if board_path.endswith(".emn"):
-                library_path = board_path[:-3] + "emp"
-            if board_path.endswith(".bdf"):
-                library_path = board_path[:-3] + "ldf"
-        if not control_path and os.path.exists(board_path[:-3] + "xml"):
-            control_path = board_path[:-3] + "xml"
-        else:
-            control_path = ""
-        filters = []
-        if filter_cap:
-            filters.append("Cap")
-        if filter_ind:
-            filters.append("Ind")
-        if filter_res:
-            filters.append("Res")
-        if filter_height_under:
-            filters.append("Height")
-        else:
-            filter_height_under = "0.1mm"
-        if power_under:
-            filters.append("Power")
-        else:
-            power_under = "10mW"
-        if filter_height_exclude_2d:
-            filters.append("HeightExclude2D")
-        if cutoff_height:
-            cutoff = True
-        else:
-            cutoff = False
-        if component_lib:
-            replace_device = True
-        else:
-            replace_device = False
+            if board_ext.lower() == ".emn":
+                library_path = board_root + ".emp"
+            elif board_ext.lower() == ".bdf":
+                library_path = board_root + ".ldf"
+        if not control_path:
+            control_path = board_root + ".xml" if os.path.exists(board_root + ".xml") else ""
+        board_arg = board_path.replace("\\", "\\\\")
+        library_arg = library_path.replace("\\", "\\\\")
+        control_arg = control_path.replace("\\", "\\\\")
+        filters = [
+            name
+            for enabled, name in (
+                (filter_cap, "Cap"),
+                (filter_ind, "Ind"),
+                (filter_res, "Res"),
+                (filter_height_under, "Height"),
+                (power_under, "Power"),
+                (filter_height_exclude_2d, "HeightExclude2D"),
+            )
+            if enabled
+        ]
+        cutoff = bool(cutoff_height)
+        replace_device = bool(component_lib)
+        height_value = self._arg_with_units(filter_height_under or "0.1mm")
+        power_value = self._arg_with_units(power_under or "10mW", "mW")
+        high_surface_value = self._arg_with_units(high_surface_thick)
+        low_surface_value = self._arg_with_units(low_surface_thick)
+        internal_value = self._arg_with_units(internal_thick)
+        cutoff_value = self._arg_with_units(cutoff_height)
         self.odesign.ImportIDF(
             [
                 "NAME:Settings",
                 "Board:=",
-                board_path.replace("\\", "\\\\"),
+                board_arg,
                 "Library:=",
-                library_path.replace("\\", "\\\\"),
+                library_arg,
                 "Control:=",
-                control_path.replace("\\", "\\\\"),
+                control_arg,
                 "Filters:=",
                 filters,
                 "CreateFilteredAsNonModel:=",
                 create_filtered_as_non_model,
                 "HeightVal:=",
-                self._arg_with_units(filter_height_under),
+                height_value,
                 "PowerVal:=",
-                self._arg_with_units(power_under, "mW"),
+                power_value,
                 [
                     "NAME:definitionOverridesMap",
                 ],
                 ["NAME:instanceOverridesMap"],
                 "HighSurfThickness:=",
-                self._arg_with_units(high_surface_thick),
+                high_surface_value,
                 "LowSurfThickness:=",
-                self._arg_with_units(low_surface_thick),
+                low_surface_value,
                 "InternalLayerThickness:=",
-                self._arg_with_units(internal_thick),
+                internal_value,
                 "NumInternalLayer:=",
                 internal_layer_number,
                 "HighSurfaceCopper:=",
@@ -2995,7 +2946,7 @@ class Icepak(FieldAnalysis3D):
                 "Cutoff:=",
                 cutoff,
                 "CutoffHeight:=",
-                self._arg_with_units(cutoff_height),
+                cutoff_value,
                 "ReplaceDevices:=",
                 replace_device,
                 "CompLibDir:=",
@@ -3044,8 +2995,9 @@ class Icepak(FieldAnalysis3D):
         """
 
         def get_face_normal(obj_face):
-            vertex1 = obj_face.vertices[0].position
-            vertex2 = obj_face.vertices[1].position
+            vertices = obj_face.vertices
+            vertex1 = vertices[0].position
+            vertex2 = vertices[1].position
             face_center = obj_face.center_from_aedt
             v1 = [i - j for i, j in zip(vertex1, face_center)]
             v2 = [i - j for i, j in zip(vertex2, face_center)]
@@ -3053,70 +3005,63 @@ class Icepak(FieldAnalysis3D):
             normalized_n = GeometryOperators.normalize_vector(n)
             return normalized_n
 
+        def normals_dot(n1, n2):
+            return round(n1[0] * n2[0] + n1[1] * n2[1] + n1[2] * n2[2])
+
+        def get_aligned_face(faces, normal, direction):
+            # First face whose normal is parallel (1) or anti-parallel (-1) to ``normal``, with its normal.
+            for face in faces:
+                face_normal = get_face_normal(face)
+                if normals_dot(normal, face_normal) == direction:
+                    return face, face_normal
+            return None, None
+
         net_handle = self.modeler.get_object_from_name(object_name)
         if pcb in self.modeler.user_defined_component_names:
+            layer_pattern = re.compile(re.escape(self.modeler.user_defined_components[pcb].definition_name) + r"_\d{3}")
             part_names = sorted(
-                [
-                    pcb_layer
-                    for pcb_layer in self.modeler.get_3d_component_object_list(componentname=pcb)
-                    if re.search(self.modeler.user_defined_components[pcb].definition_name + r"_\d\d\d.*", pcb_layer)
-                ]
+                pcb_layer
+                for pcb_layer in self.modeler.get_3d_component_object_list(componentname=pcb)
+                if layer_pattern.search(pcb_layer)
             )
 
             pcb_layers = [part_names[0], part_names[-1]]
             for layer in pcb_layers:
-                x = self.modeler.get_object_from_name(object_name).get_touching_faces(layer)
+                x = net_handle.get_touching_faces(layer)
                 if x:
                     board_side = x[0]
                     board_side_normal = get_face_normal(board_side)
                     pcb_handle = self.modeler.get_object_from_name(layer)
+                    break
             pcb_faces = pcb_handle.faces_by_area(area=1e-5, area_filter=">=")
-            for face in pcb_faces:
-                pcb_normal = get_face_normal(face)
-                dot_product = round(sum([x * y for x, y in zip(board_side_normal, pcb_normal)]))
-                if dot_product == -1:
-                    pcb_face = face
-            pcb_face_normal = get_face_normal(pcb_face)
+            pcb_face, pcb_face_normal = get_aligned_face(pcb_faces, board_side_normal, -1)
         else:
             pcb_handle = self.modeler.get_object_from_name(pcb)
-            board_side = self.modeler.get_object_from_name(object_name).get_touching_faces(pcb)[0]
+            board_side = net_handle.get_touching_faces(pcb)[0]
             board_side_normal = get_face_normal(board_side)
-            for face in pcb_handle.faces:
-                pcb_normal = get_face_normal(face)
-                dot_product = round(sum([x * y for x, y in zip(board_side_normal, pcb_normal)]))
-                if dot_product == -1:
-                    pcb_face = face
-            pcb_face_normal = get_face_normal(pcb_face)
-
-        for face in net_handle.faces:
-            net_face_normal = get_face_normal(face)
-            dot_product = round(sum([x * y for x, y in zip(net_face_normal, pcb_face_normal)]))
-            if dot_product == 1:
-                case_side = face
+            pcb_face, pcb_face_normal = get_aligned_face(pcb_handle.faces, board_side_normal, -1)
+
+        case_side, _ = get_aligned_face(net_handle.faces, pcb_face_normal, 1)
 
         props = {
             "Faces": [board_side.id, case_side.id],
-            "Nodes": OrderedDict(
-                {
-                    "Case_side(" + str(case_side) + ")": [case_side.id, "NoResistance"],
-                    "Board_side(" + str(board_side) + ")": [board_side.id, "NoResistance"],
-                    "Internal": [power],
-                }
-            ),
-            "Links": OrderedDict(
-                {
-                    "Rjc": ["Case_side(" + str(case_side) + ")", "Internal", "R", str(rjc) + "cel_per_w"],
-                    "Rjb": ["Board_side(" + str(board_side) + ")", "Internal", "R", str(rjb) + "cel_per_w"],
-                }
-            ),
-            "SchematicData": ({}),
+            "Nodes": {
+                "Case_side(" + str(case_side) + ")": [case_side.id, "NoResistance"],
+                "Board_side(" + str(board_side) + ")": [board_side.id, "NoResistance"],
+                "Internal": [power],
+            },
+            "Links": {
+                "Rjc": ["Case_side(" + str(case_side) + ")", "Internal", "R", str(rjc) + "cel_per_w"],
+                "Rjb": ["Board_side(" + str(board_side) + ")", "Internal", "R", str(rjb) + "cel_per_w"],
+            },
+            "SchematicData": {},
         }
 
-        self.modeler.primitives[object_name].material_name = "Ceramic_material"
+        net_handle.material_name = "Ceramic_material"
         boundary = BoundaryObject(self, object_name, props, "Network")
         if boundary.create():
             self._boundaries[boundary.name] = boundary
-            self.modeler.primitives[object_name].solve_inside = False
+            net_handle.solve_inside = False
             return boundary
         return None
 
@@ -3256,73 +3201,72 @@ class Icepak(FieldAnalysis3D):
 
         >>> oModule.AssignStationaryWallBoundary
         """
+        if boundary_condition not in ["Temperature", "Heat Flux", "Heat Transfer Coefficient"]:
+            self.logger.error("Boundary condition '{}' is not supported.".format(boundary_condition))
+            return None
+        if (
+            ht_correlation
+            and ht_correlation_type == "Natural Convection"
+            and ht_correlation_surface not in ["Top", "Bottom", "Vertical"]
+        ):
+            self.logger.error("Correlation surface '{}' is not supported.".format(ht_correlation_surface))
+            return None
         if not name:
             name = generate_unique_name("StationaryWall")
-        if isinstance(geometry, str):
-            geometry = [geometry]
-        elif isinstance(geometry, int):
+        if isinstance(geometry, (str, int)):
             geometry = [geometry]
-        if not isinstance(thickness, str):
-            thickness = "{}{}".format(thickness, self.modeler.model_units)
-        if not isinstance(heat_flux, str):
-            heat_flux = "{}irrad_W_per_m2".format(heat_flux)
-        if not isinstance(temperature, str):
-            temperature = "{}cel".format(temperature)
-        if not isinstance(htc, str):
-            htc = "{}w_per_m2kel".format(htc)
-        if not isinstance(ref_temperature, str):
-            ref_temperature = "{}cel".format(ref_temperature)
-        if not isinstance(ht_correlation_free_stream_velocity, str):
-            ht_correlation_free_stream_velocity = "{}m_per_sec".format(ht_correlation_free_stream_velocity)
-        if not isinstance(ht_correlation_amb_temperature, str):
-            ht_correlation_amb_temperature = "{}cel".format(ht_correlation_amb_temperature)
-        if not isinstance(ext_surf_rad_view_factor, str):
-            ext_surf_rad_view_factor = str(ext_surf_rad_view_factor)
 
-        props = {}
-        if isinstance(geometry[0], int):
-            props["Faces"] = geometry
+        def with_units(value, units):
+            return value if isinstance(value, str) else str(value) + units
+
+        if not isinstance(thickness, str):
+            thickness = str(thickness) + self.modeler.model_units
+        heat_flux = with_units(heat_flux, "irrad_W_per_m2")
+        temperature = with_units(temperature, "cel")
+        htc = with_units(htc, "w_per_m2kel")
+        ref_temperature = with_units(ref_temperature, "cel")
+        ht_correlation_free_stream_velocity = with_units(ht_correlation_free_stream_velocity, "m_per_sec")
+        ht_correlation_amb_temperature = with_units(ht_correlation_amb_temperature, "cel")
+        ext_surf_rad_view_factor = str(ext_surf_rad_view_factor)
+
+        if not ht_correlation:
+            heat_transfer_data = {
+                "Heat Transfer Correlation": ht_correlation,
+                "Heat Transfer Convection Type": "Forced Convection",
+            }
         else:
-            props["Objects"] = geometry
-        props["Thickness"] = (thickness,)
-        props["Solid Material"] = material
-        props["External Condition"] = boundary_condition
-        props["Heat Flux"] = heat_flux
-        props["Temperature"] = temperature
+            heat_transfer_data = {
+                "Heat Transfer Correlation": True,
+                "Heat Transfer Convection Type": ht_correlation_type,
+                "Heat Transfer Convection Fluid Material": ht_correlation_fluid,
+            }
+            if ht_correlation_type == "Forced Convection":
+                heat_transfer_data["Flow Type"] = ht_correlation_flow_type
+                heat_transfer_data["Flow Direction"] = ht_correlation_flow_direction
+                heat_transfer_data["Heat Transfer Coeff Value Type"] = ht_correlation_value_type
+                heat_transfer_data["Stream Velocity"] = ht_correlation_free_stream_velocity
+            elif ht_correlation_type == "Natural Convection":
+                heat_transfer_data["Surface"] = ht_correlation_surface
+                heat_transfer_data["Ambient Temperature"] = ht_correlation_amb_temperature
+
+        props = {
+            "Faces" if isinstance(geometry[0], int) else "Objects": geometry,
+            "Thickness": (thickness,),
+            "Solid Material": material,
+            "External Condition": boundary_condition,
+            "Heat Flux": heat_flux,
+            "Temperature": temperature,
+        }
         if htc_dataset is None:
             props["Heat Transfer Coefficient"] = htc
         else:
             props["Heat Transfer Coefficient Variation Data"] = {
                 "Variation Type": "Temp Dep",
                 "Variation Function": "Piecewise Linear",
-                "Variation Value": '["1w_per_m2kel", "pwl({},Temp)"]'.format(htc_dataset),
+                "Variation Value": '["1w_per_m2kel", "pwl(' + str(htc_dataset) + ',Temp)"]',
             }
         props["Reference Temperature"] = ref_temperature
-        props["Heat Transfer Data"] = {
-            "Heat Transfer Correlation": ht_correlation,
-            "Heat Transfer Convection Type": "Forced Convection",
-        }
-        if ht_correlation:
-            props["Heat Transfer Data"].update(
-                {
-                    "Heat Transfer Correlation": True,
-                    "Heat Transfer Convection Type": ht_correlation_type,
-                    "Heat Transfer Convection Fluid Material": ht_correlation_fluid,
-                }
-            )
-            if ht_correlation_type == "Forced Convection":
-                props["Heat Transfer Data"].update(
-                    {
-                        "Flow Type": ht_correlation_flow_type,
-                        "Flow Direction": ht_correlation_flow_direction,
-                        "Heat Transfer Coeff Value Type": ht_correlation_value_type,
-                        "Stream Velocity": ht_correlation_free_stream_velocity,
-                    }
-                )
-            elif ht_correlation_type == "Natural Convection":
-                props["Heat Transfer Data"].update(
-                    {"Surface": ht_correlation_surface, "Ambient Temperature": ht_correlation_amb_temperature}
-                )
+        props["Heat Transfer Data"] = heat_transfer_data
         props["Radiation"] = {"Radiate": radiate, "RadiateTo": "AllObjects", "Surface Material": radiate_surf_mat}
         props["Shell Conduction"] = shell_conduction
         props["External Surface Radiation"] = ext_surf_rad
@@ -3597,8 +3541,8 @@ class Icepak(FieldAnalysis3D):
             ht_correlation_flow_direction=ht_correlation_flow_direction,
             ht_correlation_value_type=ht_correlation_value_type,
             ht_correlation_free_stream_velocity=ht_correlation_free_stream_velocity,
-            ht_correlation_surface=ht_correlation_amb_temperature,
-            ht_correlation_amb_temperature=ht_correlation_surface,
+            ht_correlation_surface=ht_correlation_surface,
+            ht_correlation_amb_temperature=ht_correlation_amb_temperature,
             ext_surf_rad=ext_surf_rad,
             ext_surf_rad_material=ext_surf_rad_material,
             ext_surf_rad_ref_temp=ext_surf_rad_ref_temp,
@@ -3651,8 +3595,8 @@ class Icepak(FieldAnalysis3D):
         """
         if setuptype is None:
             setuptype = self.design_solutions.default_setup
-        elif setuptype in SetupKeys.SetupNames:
-            setuptype = SetupKeys.SetupNames.index(setuptype)
+        elif setuptype in SetupKeys.SetupNameIndex:
+            setuptype = SetupKeys.SetupNameIndex[setuptype]
         if "props" in kwargs:
             return self._create_setup(setupname=setupname, setuptype=setuptype, props=kwargs["props"])
         else:
@@ -3660,7 +3604,7 @@ class Icepak(FieldAnalysis3D):
         setup.auto_update = False
         for arg_name, arg_value in kwargs.items():
             if setup[arg_name] is not None:
-                setup[arg_name] = arg_value
+                setup._set_prop(arg_name, arg_value)
         setup.auto_update = True
         setup.update()
         return setup
@@ -3676,14 +3620,46 @@ class Icepak(FieldAnalysis3D):
         out_dict = {"Variation Type": variation_type, "Variation Function": function}
         if function == "Piecewise Linear":
             if not isinstance(variation_value, list):
-                variation_value = ["1", "pwl({},Temp)".format(variation_value)]
-            else:
-                variation_value = [variation_value[0], "pwl({},Temp)".format(variation_value[1])]
-            out_dict["Variation Value"] = "[{}]".format(", ".join(['"' + str(i) + '"' for i in variation_value]))
+                variation_value = ["1", variation_value]
+            out_dict["Variation Value"] = (
+                '["' + str(variation_value[0]) + '", "pwl(' + str(variation_value[1]) + ',Temp)"]'
+            )
         else:
             if variation_value is not None:
-                out_dict["Variation Value"] = "[{}]".format(", ".join([str(i) for i in variation_value]))
-        return {"{} Variation Data".format(quantity): out_dict}
+                out_dict["Variation Value"] = "[" + ", ".join(str(i) for i in variation_value) + "]"
+        return {quantity + " Variation Data": out_dict}
+
+    @pyaedt_function_handler()
+    def _add_quantity_props(self, props, default_values, quantity_choice, quantity_value, temperature_dependent=True):
+        """Add a value for each quantity to the boundary properties.
+
+        The quantity matching ``quantity_choice`` takes ``quantity_value``, which can be a
+        variation dictionary. The other quantities take their default values.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when the variation data is not valid.
+        """
+        for quantity, value in default_values.items():
+            if quantity != quantity_choice:
+                props[quantity] = value
+            elif isinstance(quantity_value, dict):
+                if not temperature_dependent and quantity_value["Type"] == "Temp Dep":
+                    self.logger.error("{} assignment does not support temperature dependence.".format(quantity))
+                    return False
+                variation_data = self._parse_variation_data(
+                    quantity,
+                    quantity_value["Type"],
+                    variation_value=quantity_value["Values"],
+                    function=quantity_value["Function"],
+                )
+                if variation_data is None:
+                    return False
+                props.update(variation_data)
+            else:
+                props[quantity] = quantity_value
+        return True
 
     @pyaedt_function_handler()
     def assign_source(
@@ -3764,45 +3740,19 @@ class Icepak(FieldAnalysis3D):
         elif isinstance(assignment[0], str):
             props["Objects"] = assignment
         props["Thermal Condition"] = thermal_condition
-        for quantity, value in default_values.items():
-            if quantity == thermal_condition:
-                if isinstance(assignment_value, dict):
-                    assignment_value = self._parse_variation_data(
-                        quantity,
-                        assignment_value["Type"],
-                        variation_value=assignment_value["Values"],
-                        function=assignment_value["Function"],
-                    )
-                    if assignment_value is None:
-                        return None
-                    props.update(assignment_value)
-                else:
-                    props[quantity] = assignment_value
-            else:
-                props[quantity] = value
-        props["Radiation"] = OrderedDict({"Radiate": radiate})
+        if not self._add_quantity_props(props, default_values, thermal_condition, assignment_value):
+            return None
+        props["Radiation"] = {"Radiate": radiate}
         props["Voltage/Current - Enabled"] = bool(voltage_current_choice)
-        default_values = {"Current": "0A", "Voltage": "0V"}
         props["Voltage/Current Option"] = voltage_current_choice
-        for quantity, value in default_values.items():
-            if voltage_current_choice == quantity:
-                if isinstance(voltage_current_value, dict):
-                    if voltage_current_value["Type"] == "Temp Dep":
-                        self.logger.error("Voltage or Current assignment does not support temperature dependence.")
-                        return None
-                    voltage_current_value = self._parse_variation_data(
-                        quantity,
-                        voltage_current_value["Type"],
-                        variation_value=voltage_current_value["Values"],
-                        function=voltage_current_value["Function"],
-                    )
-                    if voltage_current_value == None:
-                        return None
-                    props.update(voltage_current_value)
-                else:
-                    props[quantity] = voltage_current_value
-            else:
-                props[quantity] = value
+        if not self._add_quantity_props(
+            props,
+            {"Current": "0A", "Voltage": "0V"},
+            voltage_current_choice,
+            voltage_current_value,
+            temperature_dependent=False,
+        ):
+            return None
 
         bound = BoundaryObject(self, boundary_name, props, "SourceIcepak")
         if bound.create():
@@ -3911,10 +3861,11 @@ class Icepak(FieldAnalysis3D):
             node_name = None if not node_names else node_names[i + len(sources_power)]
             second = net.add_face_node(id, name=node_name)
             all_nodes.append(second.name)
-        for i in range(len(matrix)):
-            for j in range(len(matrix[0])):
-                if matrix[i][j] > 0:
-                    net.add_link(all_nodes[i], all_nodes[j], matrix[i][j], "Link_" + all_nodes[i] + "_" + all_nodes[j])
+        for i, row in enumerate(matrix):
+            node_i = all_nodes[i]
+            for j in range(i):
+                if row[j] > 0:
+                    net.add_link(node_i, all_nodes[j], row[j], "Link_" + node_i + "_" + all_nodes[j])
         if net.create():
             self._boundaries[net.name] = net
             return net
@@ -3998,25 +3949,24 @@ class Icepak(FieldAnalysis3D):
         if not isinstance(object_name, list):
             object_name = [object_name]
         for o_n in object_name:
-            if not self.modeler.get_object_from_name(o_n).solve_inside:
+            obj = self.modeler.get_object_from_name(o_n)
+            if obj is None:
+                self.logger.add_error_message("Object {} not found in the design.".format(o_n))
+                return None
+            if not obj.solve_inside:
                 self.logger.add_error_message(
                     "Use the ``assign_hollow_block()`` method with this object as ``solve_inside`` is ``False``."
                 )
                 return None
         props = {"Block Type": "Solid", "Objects": object_name}
         if isinstance(power_assignment, dict):
-            assignment_value = self._parse_variation_data(
-                "Total Power",
-                power_assignment["Type"],
-                variation_value=power_assignment["Values"],
-                function=power_assignment["Function"],
+            props.update(
+                self._parse_variation_data(
+                    "Total Power", power_assignment["Type"], power_assignment["Values"], power_assignment["Function"]
+                )
             )
-            props.update(assignment_value)
         elif power_assignment == "Joule Heating":
-            assignment_value = self._parse_variation_data(
-                "Total Power", "Joule Heating", variation_value=None, function="None"
-            )
-            props.update(assignment_value)
+            props.update(self._parse_variation_data("Total Power", "Joule Heating", None, "None"))
         elif isinstance(power_assignment, (float, int)):
             props["Total Power"] = str(power_assignment) + "W"
         else:
@@ -4024,18 +3974,19 @@ class Icepak(FieldAnalysis3D):
 
         if htc:
             props["Use External Conditions"] = True
-            for quantity, assignment in [("Temperature", ext_temperature), ("Heat Transfer Coefficient", htc)]:
+            for quantity, assignment, unit in [
+                ("Temperature", ext_temperature, "cel"),
+                ("Heat Transfer Coefficient", htc, "w_per_m2kel"),
+            ]:
                 if isinstance(assignment, dict):
-                    assignment_value = self._parse_variation_data(
-                        quantity,
-                        assignment["Type"],
-                        variation_value=assignment["Values"],
-                        function=assignment["Function"],
+                    props.update(
+                        self._parse_variation_data(
+                            quantity, assignment["Type"], assignment["Values"], assignment["Function"]
+                        )
                     )
-                    props.update(assignment_value)
                 else:
                     if isinstance(assignment, (float, int)):
-                        assignment = str(assignment) + ["w_per_m2kel", "cel"][int(quantity == "Temperature")]
+                        assignment = str(assignment) + unit
                     props[quantity] = assignment
         else:
             props["Use External Conditions"] = False
@@ -4119,13 +4070,7 @@ class Icepak(FieldAnalysis3D):
             )
             return None
 
-        assignment_dict = {
-            "Total Power": ["Fixed Heat", "Total Power"],
-            "Heat Flux": ["Fixed Heat", "Heat Flux"],
-            "Temperature": ["Fixed Temperature", "Fixed Temperature"],
-            "Heat Transfer Coefficient": ["Internal Conditions", "Heat Transfer Coefficient"],
-        }
-        thermal_condition = assignment_dict.get(assignment_type, None)
+        thermal_condition = HOLLOW_BLOCK_CONDITIONS.get(assignment_type, None)
         if thermal_condition is None:
             self.logger.add_error_message(
                 'Valid options for assignment type are "Total Power", "Heat Flux",'
@@ -4137,41 +4082,42 @@ class Icepak(FieldAnalysis3D):
         if not isinstance(object_name, list):
             object_name = [object_name]
         for o_n in object_name:
-            if self.modeler.get_object_from_name(o_n).solve_inside:
+            obj = self.modeler.get_object_from_name(o_n)
+            if obj is None:
+                self.logger.add_error_message("Object {} not found in the design.".format(o_n))
+                return None
+            if obj.solve_inside:
                 self.logger.add_error_message(
                     "Use ``assign_solid_block`` method with this object as ``solve_inside`` is ``True``."
                 )
                 return None
-        props = {"Block Type": "Hollow", "Objects": object_name, "Thermal Condition": thermal_condition[0]}
-        if thermal_condition[0] == "Fixed Heat":
-            props["Use Total Power"] = thermal_condition[1] == "Total Power"
+        condition, quantity = thermal_condition
+        props = {"Block Type": "Hollow", "Objects": object_name, "Thermal Condition": condition}
+        if condition == "Fixed Heat":
+            props["Use Total Power"] = quantity == "Total Power"
         if isinstance(assignment_value, dict):
-            assignment_value_dict = self._parse_variation_data(
-                thermal_condition[1],
-                assignment_value["Type"],
-                variation_value=assignment_value["Values"],
-                function=assignment_value["Function"],
+            props.update(
+                self._parse_variation_data(
+                    quantity, assignment_value["Type"], assignment_value["Values"], assignment_value["Function"]
+                )
             )
-            props.update(assignment_value_dict)
         elif assignment_value == "Joule Heating":
-            assignment_value_dict = self._parse_variation_data(
-                thermal_condition[1], "Joule Heating", variation_value=None, function="None"
-            )
-            props.update(assignment_value_dict)
+            props.update(self._parse_variation_data(quantity, "Joule Heating", None, "None"))
         else:
-            props[thermal_condition[1]] = assignment_value
-        if thermal_condition[0] == "Internal Conditions":
+            props[quantity] = assignment_value
+        if condition == "Internal Conditions":
             if isinstance(external_temperature, dict):
                 if external_temperature["Type"] == "Temp Dep":
                     self.logger.add_error_message('It is not possible to use "Temp Dep" for a temperature assignment.')
                     return None
-                assignment_value_dict = self._parse_variation_data(
-                    "Temperature",
-                    external_temperature["Type"],
-                    variation_value=external_temperature["Values"],
-                    function=external_temperature["Function"],
+                props.update(
+                    self._parse_variation_data(
+                        "Temperature",
+                        external_temperature["Type"],
+                        external_temperature["Values"],
+                        external_temperature["Function"],
+                    )
                 )
-                props.update(assignment_value_dict)
             else:
                 props["Temperature"] = external_temperature
 
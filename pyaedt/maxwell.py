@@ -2122,8 +2122,8 @@ class Maxwell(object):
         """
         if setuptype is None:
             setuptype = self.design_solutions.default_setup
-        elif setuptype in SetupKeys.SetupNames:
-            setuptype = SetupKeys.SetupNames.index(setuptype)
+        elif setuptype in SetupKeys.SetupNameIndex:
+            setuptype = SetupKeys.SetupNameIndex[setuptype]
         if "props" in kwargs:
             return self._create_setup(setupname=setupname, setuptype=setuptype, props=kwargs["props"])
         else:
@@ -2131,7 +2131,7 @@ class Maxwell(object):
         setup.auto_update = False
         for arg_name, arg_value in kwargs.items():
             if setup[arg_name] is not None:
-                setup[arg_name] = arg_value
+                setup._set_prop(arg_name, arg_value)
         setup.auto_update = True
         setup.update()
         return setup
@@ -668,8 +668,8 @@ class Mechanical(FieldAnalysis3D, object):
         """
         if setuptype is None:
             setuptype = self.design_solutions.default_setup
-        elif setuptype in SetupKeys.SetupNames:
-            setuptype = SetupKeys.SetupNames.index(setuptype)
+        elif setuptype in SetupKeys.SetupNameIndex:
+            setuptype = SetupKeys.SetupNameIndex[setuptype]
         if "props" in kwargs:
             return self._create_setup(setupname=setupname, setuptype=setuptype, props=kwargs["props"])
         else:
@@ -677,7 +677,7 @@ class Mechanical(FieldAnalysis3D, object):
         setup.auto_update = False
         for arg_name, arg_value in kwargs.items():
             if setup[arg_name] is not None:
-                setup[arg_name] = arg_value
+                setup._set_prop(arg_name, arg_value)
         setup.auto_update = True
         setup.update()
         return setup
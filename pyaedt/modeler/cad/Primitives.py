@@ -1501,8 +1501,8 @@ class Primitives(object):
 
         Parameters
         ----------
-        materialname : str
-            Name of the material. The default is ``None``.
+        materialname : str or list, optional
+            Name of the material or list of material names. The default is ``None``.
 
         Returns
         -------
@@ -1512,7 +1512,8 @@ class Primitives(object):
             of conductors, dielectrics, gases and liquids respectively
             in the design and values are objects assigned to these materials.
             If a material name is provided, the method returns a list
-            of objects assigned to the material.
+            of objects assigned to the material. If a list of material names
+            is provided, the objects are grouped by material in the order given.
 
         References
         ----------
@@ -1522,18 +1523,13 @@ class Primitives(object):
         """
         obj_lst = []
         if materialname is not None:
-            for obj in self.object_list:
-                if obj and ("[" in obj.material_name or "(" in obj.material_name) and obj.object_type == "Solid":
-                    material = (
-                        self._app.odesign.GetChildObject("3D Modeler")
-                        .GetChildObject(obj.name)
-                        .GetPropEvaluatedValue("Material")
-                        .lower()
-                    )
-                    if materialname.lower() == material:
-                        obj_lst.append(obj)
-                elif obj and (obj.material_name == materialname or obj.material_name == materialname.lower()):
-                    obj_lst.append(obj)
+            materialnames = materialname if isinstance(materialname, list) else [materialname]
+            if materialnames:
+                # Variable materials are evaluated once per object, whatever the number of requested materials.
+                object_materials = [(obj, self._get_evaluated_material(obj)) for obj in self.object_list if obj]
+                for name in materialnames:
+                    keys = (name, name.lower())
+                    obj_lst.extend(obj for obj, material in object_materials if material in keys)
         else:
             obj_lst = [
                 self._get_object_dict_by_material(self.materials.conductors),
@@ -1543,6 +1539,17 @@ class Primitives(object):
             ]
         return obj_lst
 
+    def _get_evaluated_material(self, obj):
+        material_name = obj.material_name
+        if ("[" in material_name or "(" in material_name) and obj.object_type == "Solid":
+            return (
+                self._app.odesign.GetChildObject("3D Modeler")
+                .GetChildObject(obj.name)
+                .GetPropEvaluatedValue("Material")
+                .lower()
+            )
+        return material_name
+
     @pyaedt_function_handler()
     def find_closest_edges(self, start_obj, end_obj, port_direction=0):
         """Retrieve the two closest edges that are not perpendicular for two objects.
@@ -95,9 +95,7 @@ class BoundaryCommon(PropsManager):
             self._app.o_maxwell_parameters.DeleteParameters([self.name])
         else:
             self._app.oboundary.DeleteBoundaries([self.name])
-        for el in self._app.boundaries:
-            if el.name == self.name:
-                self._app.boundaries.remove(el)
+        self._app._boundaries.pop(self.name, None)
         return True
 
     def _get_boundary_data(self, ds):
@@ -321,11 +319,9 @@ class NativeComponentObject(BoundaryCommon, object):
 
         """
         self._app.modeler.oeditor.Delete(["NAME:Selections", "Selections:=", self.name])
-        for el in self._app._native_components:
-            if el.component_name == self.component_name:
-                self._app._native_components.remove(el)
-                del self._app.modeler.user_defined_components[self.name]
-                self._app.modeler.cleanup_objects()
+        if self._app._native_components.pop(self.component_name, None):
+            del self._app.modeler.user_defined_components[self.name]
+            self._app.modeler.cleanup_objects()
         return True
 
 
@@ -363,7 +359,7 @@ class BoundaryObject(BoundaryCommon, object):
         self._name = name
         self._props = None
         if props:
-            self._props = BoundaryProps(self, OrderedDict(props))
+            self._props = BoundaryProps(self, props)
         self._type = boundarytype
         self._boundary_name = self.name
         self.auto_update = auto_update
@@ -431,7 +427,7 @@ class BoundaryObject(BoundaryCommon, object):
         props = self._get_boundary_data(self.name)
 
         if props:
-            self._props = BoundaryProps(self, OrderedDict(props[0]))
+            self._props = BoundaryProps(self, props[0])
             self._type = props[1]
         return self._props
 
@@ -875,7 +871,7 @@ class MaxwellParameters(BoundaryCommon, object):
         self._name = name
         self._props = None
         if props:
-            self._props = BoundaryProps(self, OrderedDict(props))
+            self._props = BoundaryProps(self, props)
         self.type = boundarytype
         self._boundary_name = self.name
         self.auto_update = True
@@ -915,7 +911,7 @@ class MaxwellParameters(BoundaryCommon, object):
         props = self._get_boundary_data(self.name)
 
         if props:
-            self._props = BoundaryProps(self, OrderedDict(props[0]))
+            self._props = BoundaryProps(self, props[0])
             self._type = props[1]
         return self._props
 
@@ -1784,7 +1780,7 @@ class BoundaryObject3dLayout(BoundaryCommon, object):
         self._name = name
         self._props = None
         if props:
-            self._props = BoundaryProps(self, OrderedDict(props))
+            self._props = BoundaryProps(self, props)
         self.type = boundarytype
         self._boundary_name = self.name
         self.auto_update = True
@@ -1837,7 +1833,7 @@ class BoundaryObject3dLayout(BoundaryCommon, object):
         props = self._get_boundary_data(self.name)
 
         if props:
-            self._props = BoundaryProps(self, OrderedDict(props[0]))
+            self._props = BoundaryProps(self, props[0])
             self._type = props[1]
         return self._props
 
@@ -3576,9 +3572,9 @@ class NetworkObject(BoundaryObject):
         super(NetworkObject, self).__init__(app, self._name, props, "Network", False)
         if self.props is None:
             self._props = {}
-        self._nodes = []
-        self._links = []
-        self._schematic_data = OrderedDict({})
+        self._nodes = OrderedDict()
+        self._links = OrderedDict()
+        self._schematic_data = {}
         self._update_from_props()
         if create:
             self.create()
@@ -3594,19 +3590,19 @@ class NetworkObject(BoundaryObject):
             True if successful.
         """
         if not self.props.get("Faces", None):
-            self.props["Faces"] = [node.props["FaceID"] for _, node in self.face_nodes.items()]
+            self.props["Faces"] = self.faces_ids_in_network
         if not self.props.get("SchematicData", None):
-            self.props["SchematicData"] = OrderedDict({})
+            self.props["SchematicData"] = {}
         self._app.oboundary.AssignNetworkBoundary(self._get_args())
         return True
 
     @pyaedt_function_handler
     def _update_from_props(self):
+        # Every tracked node and link is written to props, so equal sizes mean there is nothing new to load.
         nodes = self.props.get("Nodes", None)
-        if nodes is not None:
-            nd_name_list = [node.name for node in self._nodes]
+        if nodes and len(nodes) != len(self._nodes):
             for node_name, node_dict in nodes.items():
-                if node_name not in nd_name_list:
+                if node_name not in self._nodes:
                     nd_type = node_dict.get("NodeType", None)
                     if nd_type == "InternalNode":
                         self.add_internal_node(
@@ -3640,10 +3636,9 @@ class NetworkObject(BoundaryObject):
                             resistance=node_resistance,
                         )
         links = self.props.get("Links", None)
-        if links is not None:
-            l_name_list = [l.name for l in self._links]
+        if links and len(links) != len(self._links):
             for link_name, link_dict in links.items():
-                if link_name not in l_name_list:
+                if link_name not in self._links:
                     self.add_link(link_dict[0], link_dict[1], link_dict[-1], link_name)
 
     @property
@@ -3686,7 +3681,7 @@ class NetworkObject(BoundaryObject):
 
         """
         self._update_from_props()
-        return {link.name: link for link in self._links}
+        return dict(self._links)
 
     @property
     def r_links(self):
@@ -3700,7 +3695,7 @@ class NetworkObject(BoundaryObject):
 
         """
         self._update_from_props()
-        return {link.name: link for link in self._links if link._link_type[0] == "R-Link"}
+        return {link.name: link for link in self._links.values() if link._link_type[0] == "R-Link"}
 
     @property
     def c_links(self):
@@ -3714,7 +3709,7 @@ class NetworkObject(BoundaryObject):
 
         """
         self._update_from_props()
-        return {link.name: link for link in self._links if link._link_type[0] == "C-Link"}
+        return {link.name: link for link in self._links.values() if link._link_type[0] == "C-Link"}
 
     @property
     def nodes(self):
@@ -3728,7 +3723,7 @@ class NetworkObject(BoundaryObject):
 
         """
         self._update_from_props()
-        return {node.name: node for node in self._nodes}
+        return dict(self._nodes)
 
     @property
     def face_nodes(self):
@@ -3742,7 +3737,7 @@ class NetworkObject(BoundaryObject):
 
         """
         self._update_from_props()
-        return {node.name: node for node in self._nodes if node.node_type == "FaceNode"}
+        return {node.name: node for node in self._nodes.values() if node.node_type == "FaceNode"}
 
     @property
     def faces_ids_in_network(self):
@@ -3755,10 +3750,7 @@ class NetworkObject(BoundaryObject):
             Face IDs.
 
         """
-        out_arr = []
-        for _, node_dict in self.face_nodes.items():
-            out_arr.append(node_dict.props["FaceID"])
-        return out_arr
+        return [node.props["FaceID"] for node in self.face_nodes.values()]
 
     @property
     def objects_in_network(self):
@@ -3771,10 +3763,8 @@ class NetworkObject(BoundaryObject):
             Objects names.
 
         """
-        out_arr = []
-        for face_id in self.faces_ids_in_network:
-            out_arr.append(self._app.oeditor.GetObjectNameByFaceID(face_id))
-        return out_arr
+        oeditor = self._app.oeditor
+        return [oeditor.GetObjectNameByFaceID(face_id) for face_id in self.faces_ids_in_network]
 
     @property
     def internal_nodes(self):
@@ -3788,7 +3778,7 @@ class NetworkObject(BoundaryObject):
 
         """
         self._update_from_props()
-        return {node.name: node for node in self._nodes if node.node_type == "InternalNode"}
+        return {node.name: node for node in self._nodes.values() if node.node_type == "InternalNode"}
 
     @property
     def boundary_nodes(self):
@@ -3802,7 +3792,7 @@ class NetworkObject(BoundaryObject):
 
         """
         self._update_from_props()
-        return {node.name: node for node in self._nodes if node.node_type == "BoundaryNode"}
+        return {node.name: node for node in self._nodes.values() if node.node_type == "BoundaryNode"}
 
     @property
     def name(self):
@@ -3826,7 +3816,7 @@ class NetworkObject(BoundaryObject):
         new_network_name: str
             New name of the network.
         """
-        bound_names = [b.name for b in self._app.boundaries]
+        bound_names = set(b.name for b in self._app.boundaries)
         if self.name in bound_names:
             if new_network_name not in bound_names:
                 if new_network_name != self._name:
@@ -3874,11 +3864,10 @@ class NetworkObject(BoundaryObject):
         >>> network.add_internal_node("TestNode", {"Type": "Transient",
         >>>                                        "Function": "Linear", "Values": ["0.01W", "1"]})
         """
-        if self._app.solution_type != "SteadyState" and mass is None and specific_heat is None:
+        steady_state = self._app.solution_type == "SteadyState"
+        if not steady_state and mass is None and specific_heat is None:
             self._app.logger.warning("The solution is transient but neither mass nor specific heat is assigned.")
-        if self._app.solution_type == "SteadyState" and (
-            mass is not None or specific_heat is not None
-        ):  # pragma: no cover
+        if steady_state and (mass is not None or specific_heat is not None):  # pragma: no cover
             self._app.logger.warning(
                 "Because the solution is steady state, neither mass nor specific heat assignment is relevant."
             )
@@ -3894,7 +3883,7 @@ class NetworkObject(BoundaryObject):
                 specific_heat = str(specific_heat) + "J_per_Kelkg"
             props_dict.update({"SpecificHeat": specific_heat})
         new_node = self._Node(name, self._app, node_type="InternalNode", props=props_dict, network=self)
-        self._nodes.append(new_node)
+        self._nodes[new_node.name] = new_node
         self._add_to_props(new_node)
         return new_node
 
@@ -3950,16 +3939,13 @@ class NetworkObject(BoundaryObject):
             props={"ValueType": assignment_type + "Value", assignment_type: value},
             network=self,
         )
-        self._nodes.append(new_node)
+        self._nodes[new_node.name] = new_node
         self._add_to_props(new_node)
         return new_node
 
     @pyaedt_function_handler()
     def _add_to_props(self, new_node, type_dict="Nodes"):
-        try:
-            self.props[type_dict].update({new_node.name: new_node.props})
-        except KeyError:
-            self.props[type_dict] = {new_node.name: new_node.props}
+        self.props.setdefault(type_dict, {})[new_node.name] = new_node.props
 
     @pyaedt_function_handler()
     def add_face_node(
@@ -4004,8 +3990,7 @@ class NetworkObject(BoundaryObject):
         >>>                       material="Al-Extruded", thickness="2mm")
         >>> network.add_face_node(faces_ids[2], name="TestNode", thermal_resistance="Specified", resistance=2)
         """
-        props_dict = OrderedDict({})
-        props_dict["FaceID"] = face_id
+        props_dict = {"FaceID": face_id}
         if thermal_resistance is not None:
             if thermal_resistance == "Compute":
                 if resistance is not None:
@@ -4043,7 +4028,7 @@ class NetworkObject(BoundaryObject):
         if name is None:
             name = "FaceID" + str(face_id)
         new_node = self._Node(name, self._app, node_type="FaceNode", props=props_dict, network=self)
-        self._nodes.append(new_node)
+        self._nodes[new_node.name] = new_node
         self._add_to_props(new_node)
         return new_node
 
@@ -4131,7 +4116,7 @@ class NetworkObject(BoundaryObject):
         if isinstance(nodes_dict, dict):
             nodes_dict = [nodes_dict]
         for node_dict in nodes_dict:
-            if "FaceID" in node_dict.keys():
+            if "FaceID" in node_dict:
                 self.add_face_node(
                     face_id=node_dict["FaceID"],
                     name=node_dict.get("Name", None),
@@ -4140,7 +4125,7 @@ class NetworkObject(BoundaryObject):
                     thickness=node_dict.get("Thickness", None),
                     resistance=node_dict.get("Resistance", None),
                 )
-            elif "ValueType" in node_dict.keys():
+            elif "ValueType" in node_dict:
                 self.add_boundary_node(
                     name=node_dict["Name"],
                     assignment_type=node_dict["ValueType"],
@@ -4194,13 +4179,11 @@ class NetworkObject(BoundaryObject):
 
         """
         if name is None:
-            new_name = True
-            while new_name:
+            name = generate_unique_name("Link")
+            while name in self._links:
                 name = generate_unique_name("Link")
-                if name not in self.links.keys():
-                    new_name = False
         new_link = self._Link(node1, node2, value, name, self)
-        self._links.append(new_link)
+        self._links[new_link.name] = new_link
         self._add_to_props(new_link, "Links")
         return True
 
@@ -4243,9 +4226,12 @@ class NetworkObject(BoundaryObject):
             connections = [connections]
         for connection in connections:
             name = connection.get("Name", None)
+            link = connection.get("Link", None)
             try:
-                self.add_link(connection["Link"][0], connection["Link"][1], connection["Link"][2], name)
-            except Exception:  # pragma : no cover
+                added = link is not None and len(link) >= 3 and self.add_link(link[0], link[1], link[2], name)
+            except (KeyError, IndexError, TypeError, ValueError):  # pragma : no cover
+                added = False
+            if not added:  # pragma : no cover
                 if name:
                     self._app.logger.error("Failed to add " + name + " link.")
                 else:
@@ -4264,11 +4250,11 @@ class NetworkObject(BoundaryObject):
             ``True`` when successful, ``False`` when failed.
 
         """
-        if self.name in [b.name for b in self._app.boundaries]:
+        if self.name in self._app.get_oo_name(self._app.odesign, "Thermal"):
             self.delete()
             try:
                 self.create()
-                self._app.boundaries.append(self)
+                self._app._boundaries[self.name] = self
                 return True
             except Exception:  # pragma : no cover
                 self._app.odesign.Undo()
@@ -4285,7 +4271,27 @@ class NetworkObject(BoundaryObject):
         """
         return self.update()
 
-    class _Link:
+    class _Link(object):
+        __slots__ = ("name", "node_1", "node_2", "_value", "_link_type", "_network")
+
+        _unit2type_conversion = {
+            "g_per_s": ("C-Link", "Node1ToNode2"),
+            "kg_per_s": ("C-Link", "Node1ToNode2"),
+            "lbm_per_min": ("C-Link", "Node1ToNode2"),
+            "lbm_per_s": ("C-Link", "Node1ToNode2"),
+            "Kel_per_W": ("R-Link", "R"),
+            "cel_per_w": ("R-Link", "R"),
+            "FahSec_per_btu": ("R-Link", "R"),
+            "Kels_per_J": ("R-Link", "R"),
+            "w_per_m2kel": ("R-Link", "HTC"),
+            "w_per_m2Cel": ("R-Link", "HTC"),
+            "btu_per_rankHrFt2": ("R-Link", "HTC"),
+            "btu_per_fahHrFt2": ("R-Link", "HTC"),
+            "btu_per_rankSecFt2": ("R-Link", "HTC"),
+            "btu_per_fahSecFt2": ("R-Link", "HTC"),
+            "w_per_cm2kel": ("R-Link", "HTC"),
+        }
+
         def __init__(self, node_1, node_2, value, name, network):
             self.name = name
             if not isinstance(node_1, str):
@@ -4300,26 +4306,24 @@ class NetworkObject(BoundaryObject):
             self._network = network
 
         @property
-        def _link_type(self):
-            unit2type_conversion = {
-                "g_per_s": ["C-Link", "Node1ToNode2"],
-                "kg_per_s": ["C-Link", "Node1ToNode2"],
-                "lbm_per_min": ["C-Link", "Node1ToNode2"],
-                "lbm_per_s": ["C-Link", "Node1ToNode2"],
-                "Kel_per_W": ["R-Link", "R"],
-                "cel_per_w": ["R-Link", "R"],
-                "FahSec_per_btu": ["R-Link", "R"],
-                "Kels_per_J": ["R-Link", "R"],
-                "w_per_m2kel": ["R-Link", "HTC"],
-                "w_per_m2Cel": ["R-Link", "HTC"],
-                "btu_per_rankHrFt2": ["R-Link", "HTC"],
-                "btu_per_fahHrFt2": ["R-Link", "HTC"],
-                "btu_per_rankSecFt2": ["R-Link", "HTC"],
-                "btu_per_fahSecFt2": ["R-Link", "HTC"],
-                "w_per_cm2kel": ["R-Link", "HTC"],
-            }
-            _, unit = decompose_variable_value(self.value)
-            return unit2type_conversion[unit]
+        def value(self):
+            """
+            Get link value.
+
+            Returns
+            -------
+            str
+                Value with units of the link.
+            """
+            return self._value
+
+        @value.setter
+        def value(self, value):
+            _, unit = decompose_variable_value(value)
+            if unit not in self._unit2type_conversion:
+                raise ValueError("Unknown link unit '{}'.".format(unit))
+            self._link_type = self._unit2type_conversion[unit]
+            self._value = value
 
         @property
         def props(self):
@@ -4333,7 +4337,8 @@ class NetworkObject(BoundaryObject):
                 the third element is the link type while the fourth contains the value
                 associated with the link.
             """
-            return [self.node_1, self.node_2] + self._link_type + [self.value]
+            link_type, link_quantity = self._link_type
+            return [self.node_1, self.node_2, link_type, link_quantity, self.value]
 
         @pyaedt_function_handler
         def delete_link(self):
@@ -4341,11 +4346,37 @@ class NetworkObject(BoundaryObject):
             Delete link from network.
             """
             self._network.props["Links"].pop(self.name)
-            self._network._links.remove(self)
+            self._network._links.pop(self.name, None)
+
+    class _Node(object):
+        __slots__ = ("name", "_type", "_app", "_props", "_network")
+
+        _default_props = {
+            "FaceNode": {
+                "FaceID": None,
+                "ThermalResistance": "NoResistance",
+                "Thickness": "1mm",
+                "Material": "Al-Extruded",
+                "Resistance": "0cel_per_w",
+            },
+            "BoundaryNode": {
+                "NodeType": "BoundaryNode",
+                "ValueType": "PowerValue",
+                "Power": "0W",
+                "Temperature": "25cel",
+            },
+            "InternalNode": {
+                "NodeType": "InternalNode",
+                "Power": "0W",
+                "Mass": "0.001kg",
+                "SpecificHeat": "1000J_per_Kelkg",
+            },
+        }
 
-    class _Node:
         def __init__(self, name, app, network, node_type=None, props=None):
             self.name = name
+            if node_type is None and props is not None:
+                node_type = props.get("NodeType", None) or "FaceNode"
             self._type = node_type
             self._app = app
             self._props = props
@@ -4358,7 +4389,7 @@ class NetworkObject(BoundaryObject):
             Delete node from network.
             """
             self._network.props["Nodes"].pop(self.name)
-            self._network._nodes.remove(self)
+            self._network._nodes.pop(self.name, None)
 
         @property
         def node_type(self):
@@ -4371,17 +4402,9 @@ class NetworkObject(BoundaryObject):
                 Node type.
             """
             if self._type is None:  # pragma: no cover
-                if self.props is None:
-                    self._app.logger.error(
-                        "Cannot define node_type. Both its assignment and properties assignment are missing."
-                    )
-                    return None
-                else:
-                    type_in_dict = self.props.get("NodeType", None)
-                    if type_in_dict is None:
-                        self._type = "FaceNode"
-                    else:
-                        self._type = type_in_dict
+                self._app.logger.error(
+                    "Cannot define node_type. Both its assignment and properties assignment are missing."
+                )
             return self._type
 
         @property
@@ -4410,39 +4433,13 @@ class NetworkObject(BoundaryObject):
             self._node_props()
 
         def _node_props(self):
-            face_node_default_dict = {
-                "FaceID": None,
-                "ThermalResistance": "NoResistance",
-                "Thickness": "1mm",
-                "Material": "Al-Extruded",
-                "Resistance": "0cel_per_w",
-            }
-            boundary_node_default_dict = {
-                "NodeType": "BoundaryNode",
-                "ValueType": "PowerValue",
-                "Power": "0W",
-                "Temperature": "25cel",
-            }
-            internal_node_default_dict = {
-                "NodeType": "InternalNode",
-                "Power": "0W",
-                "Mass": "0.001kg",
-                "SpecificHeat": "1000J_per_Kelkg",
-            }
+            default_dict = self._default_props.get(self.node_type, None)
+            if default_dict is None:
+                return
             if self.props is None:
-                if self.node_type == "InternalNode":
-                    self._props = internal_node_default_dict
-                elif self.node_type == "FaceNode":
-                    self._props = face_node_default_dict
-                elif self.node_type == "BoundaryNode":
-                    self._props = boundary_node_default_dict
+                self._props = default_dict.copy()
             else:
-                if self.node_type == "InternalNode":
-                    self._props = self._create_node_dict(internal_node_default_dict)
-                elif self.node_type == "FaceNode":
-                    self._props = self._create_node_dict(face_node_default_dict)
-                elif self.node_type == "BoundaryNode":
-                    self._props = self._create_node_dict(boundary_node_default_dict)
+                self._props = self._create_node_dict(default_dict)
 
         @pyaedt_function_handler()
         def _create_node_dict(self, default_dict):
@@ -4455,10 +4452,10 @@ class NetworkObject(BoundaryObject):
                     raise KeyError('"Name" key is needed for "BoundaryNodes" and "InternalNodes" dictionaries.')
             else:
                 self.name = node_name
-                node_dict.pop("Name", None)
-            node_args = copy.deepcopy(default_dict)
-            for k in node_dict.keys():
-                val = node_dict[k]
+            node_args = default_dict.copy()
+            for k, val in node_dict.items():
+                if k == "Name":
+                    continue
                 if isinstance(val, dict):  # pragma : no cover
                     val = self._app._parse_variation_data(
                         k, val["Type"], variation_value=val["Values"], function=val["Function"]
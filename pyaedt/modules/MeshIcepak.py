@@ -584,48 +584,71 @@ class IcepakMesh(object):
         >>> app.mesh.add_priority(entity_type=1, obj_list=app.modeler.object_names, priority=3)
         >>> app.mesh.add_priority(entity_type=2, comp_name=app.modeler.user_defined_component_names[0], priority=2)
         """
-        i = priority
-
-        args = ["NAME:UpdatePriorityListData"]
         if entity_type == 1:
-            non_user_defined_component_parts = self._app.modeler.oeditor.GetChildNames()
-            new_obj_list = []
-            for comp in obj_list:
-                if comp != "Region" and comp in non_user_defined_component_parts and self._app.modeler[comp].is3d:
-                    new_obj_list.append(comp)
-
-            objects = ", ".join(new_obj_list)
-            prio = [
-                "NAME:PriorityListParameters",
-                "EntityType:=",
-                "Object",
-                "EntityList:=",
-                objects,
-                "PriorityNumber:=",
-                i,
-                "PriorityListType:=",
-                "3D",
-            ]
-            self._priorities_args.append(prio)
-            args += self._priorities_args
+            return self.add_priorities([(obj_list, priority)])
         elif entity_type == 2:
-            prio = [
-                "NAME:PriorityListParameters",
-                "EntityType:=",
-                "Component",
-                "EntityList:=",
-                comp_name,
-                "PriorityNumber:=",
-                i,
-                "PriorityListType:=",
-                "3D",
+            self._priorities_args.append(self._priority_list_parameters("Component", comp_name, priority))
+        self.modeler.oeditor.UpdatePriorityList(["NAME:UpdatePriorityListData"])
+        self.modeler.oeditor.UpdatePriorityList(["NAME:UpdatePriorityListData"] + self._priorities_args)
+        return True
+
+    @pyaedt_function_handler()
+    def add_priorities(self, priorities):
+        """Add priorities to several groups of objects with a single priority list update.
+
+        Parameters
+        ----------
+        priorities : list
+            List of ``(obj_list, priority)`` tuples, where ``obj_list`` is a list of 3D objects
+            and ``priority`` is the level of priority to assign to them.
+            Non 3D objects are excluded.
+
+        Returns
+        -------
+        bool
+            ``True`` when successful, ``False`` when failed.
+
+        References
+        ----------
+
+        >>> oEditor.UpdatePriorityList
+
+        Examples
+        --------
+
+        >>> from pyaedt import Icepak
+        >>> app = Icepak()
+        >>> app.mesh.add_priorities([(["Box1", "Box2"], 2), (["Box3"], 3)])
+        """
+        non_user_defined_component_parts = set(self.modeler.oeditor.GetChildNames())
+        for obj_list, priority in priorities:
+            new_obj_list = [
+                comp
+                for comp in obj_list
+                if comp != "Region" and comp in non_user_defined_component_parts and self._app.modeler[comp].is3d
             ]
-            self._priorities_args.append(prio)
-            args += self._priorities_args
+            if new_obj_list:
+                self._priorities_args.append(
+                    self._priority_list_parameters("Object", ", ".join(new_obj_list), priority)
+                )
         self.modeler.oeditor.UpdatePriorityList(["NAME:UpdatePriorityListData"])
-        self.modeler.oeditor.UpdatePriorityList(args)
+        self.modeler.oeditor.UpdatePriorityList(["NAME:UpdatePriorityListData"] + self._priorities_args)
         return True
 
+    @staticmethod
+    def _priority_list_parameters(entity_type, entity_list, priority):
+        return [
+            "NAME:PriorityListParameters",
+            "EntityType:=",
+            entity_type,
+            "EntityList:=",
+            entity_list,
+            "PriorityNumber:=",
+            priority,
+            "PriorityListType:=",
+            "3D",
+        ]
+
     @pyaedt_function_handler()
     def assign_mesh_region(self, objectlist=[], level=5, is_submodel=False, name=None, virtual_region=False):
         """Assign a predefined surface mesh level to an object.
@@ -1652,6 +1652,9 @@ class SetupKeys:
         "TransientAPhiFormulation",
     ]
 
+    # Setup type index by name. Some names appear twice, so the first occurrence wins, as with ``list.index``.
+    SetupNameIndex = dict((name, index) for index, name in reversed(list(enumerate(SetupNames))))
+
     SetupTemplates = {
         0: HFSSDrivenAuto,
         1: HFSSDrivenDefault,
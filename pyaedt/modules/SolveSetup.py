@@ -40,8 +40,8 @@ class CommonSetup(PropsManager, object):
             self.setuptype = self.p_app.design_solutions.default_setup
         elif isinstance(solutiontype, int):
             self.setuptype = solutiontype
-        elif solutiontype in SetupKeys.SetupNames:
-            self.setuptype = SetupKeys.SetupNames.index(solutiontype)
+        elif solutiontype in SetupKeys.SetupNameIndex:
+            self.setuptype = SetupKeys.SetupNameIndex[solutiontype]
         else:
             self.setuptype = self.p_app.design_solutions._solution_options[solutiontype]["default_setup"]
         self._setupname = setupname
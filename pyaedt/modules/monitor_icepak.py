@@ -565,7 +565,9 @@ class Monitor:
             return monitor.id
 
     def _delete_removed_monitors(self):
-        existing_monitors = self._app.odesign.GetChildObject("Monitor").GetChildNames()
+        if not self._face_monitors and not self._point_monitors:
+            return
+        existing_monitors = set(self._app.odesign.GetChildObject("Monitor").GetChildNames())
         for j in [self._face_monitors, self._point_monitors]:
             for i in list(j):
                 if i not in existing_monitors: